@@ -1,15 +1,33 @@
 """Streamlit UI for the Sutta Pitaka AI Agent."""
 
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Iterator
+
+import pandas as pd
 import streamlit as st
 
-from src.agent import SuttaPitakaAgent, AgentPhase, AgentProgress
-from src.config import get_default_model, SEARCH_TOP_K_DEFAULT, SEARCH_TOP_K_MAX
+from src.agent import (
+    SuttaPitakaAgent,
+    AgentPhase,
+    AgentProgress,
+    AgentResponse,
+    ResponseCache,
+    get_agent_loop,
+)
+from src.config import (
+    ModelConfig,
+    get_default_model,
+    SEARCH_TOP_K_DEFAULT,
+    SEARCH_TOP_K_MAX,
+)
 from src.dictionary import (
     PaliDictionary,
     PaliTextSearch,
     DPPNDictionary,
     EnglishToPaliDictionary,
 )
+from src.indexing import VectorStoreManager
 from src.retrieval import SuttaSearchEngine
 
 
@@ -20,115 +38,245 @@ st.set_page_config(
     layout="wide",
 )
 
+# Progress icon for each agent phase
+PHASE_ICONS = {
+    AgentPhase.RECALL: "🧠",
+    AgentPhase.SEARCH: "🔍",
+    AgentPhase.ANALYZE: "📊",
+    AgentPhase.SYNTHESIZE: "✍️",
+    AgentPhase.LEARN: "💾",
+    AgentPhase.COMPLETE: "✅",
+}
+
+
+# Shared resources
+# These are created once per process and shared by every browser session,
+# so the embedding model, ChromaDB client and dictionaries are loaded once.
+
+@st.cache_resource(show_spinner=False)
+def get_vector_store() -> VectorStoreManager:
+    """Get the shared vector store."""
+    return VectorStoreManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_agent(model_id: str) -> SuttaPitakaAgent:
+    """Get the shared agent for a model."""
+    return SuttaPitakaAgent(vector_store=get_vector_store(), model_id=model_id)
+
+
+@st.cache_resource(show_spinner="Loading dictionary...")
+def get_pali_dict() -> PaliDictionary:
+    """Get the shared Pali-English dictionary, loading it on first use."""
+    pali_dict = PaliDictionary()
+    pali_dict.load()
+    return pali_dict
+
+
+@st.cache_resource(show_spinner=False)
+def get_pali_search() -> PaliTextSearch:
+    """Get the shared Pali text search."""
+    return PaliTextSearch()
+
+
+@st.cache_resource(show_spinner=False)
+def get_sutta_search() -> SuttaSearchEngine:
+    """Get the shared sutta search engine."""
+    return SuttaSearchEngine(vector_store=get_vector_store())
+
+
+@st.cache_resource(show_spinner="Loading DPPN dictionary...")
+def get_dppn() -> DPPNDictionary:
+    """Get the shared DPPN dictionary, loading it on first use."""
+    dppn = DPPNDictionary()
+    dppn.load()
+    return dppn
+
+
+@st.cache_resource(show_spinner="Building reverse index from Pali dictionary...")
+def get_eng_pali() -> EnglishToPaliDictionary:
+    """Get the shared English-Pali dictionary, loading it on first use."""
+    # Built from (and sharing) the Pali-English dictionary
+    eng_pali = EnglishToPaliDictionary(pali_dict=get_pali_dict())
+    eng_pali.load()
+    return eng_pali
+
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache() -> ResponseCache:
+    """
+    Get the shared cache of answers to repeated questions.
+
+    Cached answers don't see suttas ingested after they were produced;
+    they expire after the TTL, or when agent memory is cleared.
+    """
+    return ResponseCache(ttl=24 * 60 * 60)
+
+
+# Status queries
+# The sidebar runs on every rerun (every widget interaction), so these are
+# cached briefly instead of querying ChromaDB each time.
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_available_models() -> list[ModelConfig]:
+    """Get the models that have credentials configured."""
+    return SuttaPitakaAgent.get_available_models()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_document_count() -> int:
+    """Get the number of indexed document chunks."""
+    return get_vector_store().get_document_count()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_memory_count(_agent: SuttaPitakaAgent) -> int:
+    """Get the number of learned insights (shared by all agents)."""
+    return _agent.get_memory_count()
+
+
+def get_current_agent() -> SuttaPitakaAgent:
+    """Get the shared agent for this session's selected model."""
+    return get_agent(st.session_state.model_id)
+
+
+def iter_async(stream: AsyncIterator) -> Iterator:
+    """Iterate an async generator on the shared event loop from the script thread."""
+    loop = get_agent_loop()
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(stream.__anext__(), loop).result()
+            except StopAsyncIteration:
+                break
+    finally:
+        asyncio.run_coroutine_threadsafe(stream.aclose(), loop).result()
+
+
+def throttle_progress(
+    callback: Callable[[AgentProgress], None],
+    interval: float = 0.1,
+) -> Callable[[AgentProgress], None]:
+    """
+    Wrap a progress callback so it fires at most once per interval.
+
+    Phase changes always go through immediately; further updates within
+    the same phase are dropped until the interval has passed.
+    """
+    last_phase = None
+    last_time = 0.0
+
+    def throttled(progress: AgentProgress) -> None:
+        nonlocal last_phase, last_time
+        now = time.monotonic()
+        if progress.phase != last_phase or now - last_time >= interval:
+            last_phase = progress.phase
+            last_time = now
+            callback(progress)
+
+    return throttled
+
 
 def init_session_state():
     """Initialize session state variables."""
-    if "agent" not in st.session_state:
-        st.session_state.agent = SuttaPitakaAgent()
     if "messages" not in st.session_state:
         st.session_state.messages = []
     if "model_id" not in st.session_state:
         st.session_state.model_id = get_default_model().id
-    if "pali_dict" not in st.session_state:
-        st.session_state.pali_dict = PaliDictionary()
-    if "pali_search" not in st.session_state:
-        st.session_state.pali_search = PaliTextSearch()
-    if "sutta_search" not in st.session_state:
-        st.session_state.sutta_search = SuttaSearchEngine()
-    if "dppn_dict" not in st.session_state:
-        st.session_state.dppn_dict = DPPNDictionary()
-    if "eng_pali_dict" not in st.session_state:
-        st.session_state.eng_pali_dict = EnglishToPaliDictionary()
 
 
+@st.fragment
 def render_sidebar():
-    """Render the sidebar with settings."""
-    with st.sidebar:
-        st.title("Settings")
+    """Render the sidebar with settings (call inside st.sidebar)."""
+    st.title("Settings")
 
-        # Model selection
-        st.subheader("LLM Model")
+    # Model selection
+    st.subheader("LLM Model")
 
-        available_models = st.session_state.agent.get_available_models()
+    available_models = get_available_models()
 
-        if not available_models:
-            st.error("No models available. Check Ollama or add API keys.")
-        else:
-            model_options = {m.id: m.display_name for m in available_models}
-            current_model_id = st.session_state.model_id
-            model_ids = list(model_options.keys())
+    if not available_models:
+        st.error("No models available. Check Ollama or add API keys.")
+    else:
+        model_options = {m.id: m.display_name for m in available_models}
+        current_model_id = st.session_state.model_id
+        model_ids = list(model_options.keys())
 
-            if current_model_id not in model_ids:
-                current_model_id = model_ids[0]
+        if current_model_id not in model_ids:
+            current_model_id = model_ids[0]
 
-            current_index = model_ids.index(current_model_id)
-
-            selected_model_id = st.selectbox(
-                "Choose model:",
-                options=model_ids,
-                format_func=lambda x: model_options[x],
-                index=current_index,
-            )
+        current_index = model_ids.index(current_model_id)
 
-            current_model = next(
-                (m for m in available_models if m.id == selected_model_id), None
-            )
-            if current_model:
-                st.caption(current_model.description)
-                if current_model.is_free:
-                    st.caption("💚 Free (runs locally)")
+        selected_model_id = st.selectbox(
+            "Choose model:",
+            options=model_ids,
+            format_func=lambda x: model_options[x],
+            index=current_index,
+        )
 
-            if selected_model_id != st.session_state.model_id:
+        current_model = next(
+            (m for m in available_models if m.id == selected_model_id), None
+        )
+        if current_model:
+            st.caption(current_model.description)
+            if current_model.is_free:
+                st.caption("💚 Free (runs locally)")
+
+        if selected_model_id != st.session_state.model_id:
+            try:
+                get_agent(selected_model_id)
                 st.session_state.model_id = selected_model_id
-                try:
-                    st.session_state.agent.set_model(selected_model_id)
-                    st.success(f"Switched to {model_options[selected_model_id]}")
-                except ValueError as e:
-                    st.error(str(e))
-
-        # Status
-        st.divider()
-        st.subheader("Status")
-
-        if st.session_state.agent.is_ready():
-            doc_count = st.session_state.agent.get_document_count()
-            st.success(f"Ready - {doc_count:,} chunks indexed")
-        else:
-            st.warning("No suttas indexed yet")
-            st.info("Run `python ingest.py --nikaya mn` to index suttas")
-
-        # Memory status
-        st.divider()
-        st.subheader("Agent Memory")
-        memory_count = st.session_state.agent.get_memory_count()
-        st.info(f"{memory_count} learned insight{'s' if memory_count != 1 else ''}")
-
-        if memory_count > 0:
-            if st.button("Clear Memory", use_container_width=True):
-                st.session_state.agent.clear_memory()
-                st.rerun()
-
-        # Clear chat button
-        st.divider()
-        if st.button("Clear Chat", use_container_width=True):
-            st.session_state.messages = []
+                st.success(f"Switched to {model_options[selected_model_id]}")
+            except ValueError as e:
+                st.error(str(e))
+
+    # Status
+    st.divider()
+    st.subheader("Status")
+
+    doc_count = get_document_count()
+    if doc_count > 0:
+        st.success(f"Ready - {doc_count:,} chunks indexed")
+    else:
+        st.warning("No suttas indexed yet")
+        st.info("Run `python ingest.py --nikaya mn` to index suttas")
+
+    # Memory status
+    st.divider()
+    st.subheader("Agent Memory")
+    agent = get_current_agent()
+    memory_count = get_memory_count(agent)
+    st.info(f"{memory_count} learned insight{'s' if memory_count != 1 else ''}")
+
+    if memory_count > 0:
+        if st.button("Clear Memory", use_container_width=True):
+            agent.clear_memory()
+            get_response_cache().clear()
+            get_memory_count.clear()
             st.rerun()
 
-        # About section
-        st.divider()
-        st.subheader("About")
-        st.markdown("""
-        **Sutta Pitaka AI Agent**
+    # Clear chat button
+    st.divider()
+    if st.button("Clear Chat", use_container_width=True):
+        st.session_state.messages = []
+        st.rerun()
+
+    # About section
+    st.divider()
+    st.subheader("About")
+    st.markdown("""
+    **Sutta Pitaka AI Agent**
 
-        Ask questions about the Sutta Pitaka.
-        The agent iteratively searches for
-        comprehensive answers and remembers
-        insights for future queries.
+    Ask questions about the Sutta Pitaka.
+    The agent iteratively searches for
+    comprehensive answers and remembers
+    insights for future queries.
 
-        Data source: [SuttaCentral](https://suttacentral.net)
-        """)
+    Data source: [SuttaCentral](https://suttacentral.net)
+    """)
 
 
+@st.fragment
 def render_pali_tools():
     """Render the Pali tools tab."""
     st.header("Pali Tools 📚")
@@ -151,27 +299,24 @@ def render_pali_tools():
         )
 
         if pali_term:
+            pali_search = get_pali_search()
             with st.spinner("Searching..."):
-                result = st.session_state.pali_search.search(pali_term, limit=50)
+                result = pali_search.search(pali_term, limit=50)
 
             st.success(result.format_summary())
 
             if result.matches:
                 # Show by sutta
                 st.subheader("Occurrences by Sutta")
-                counts = st.session_state.pali_search.count_occurrences(pali_term)
+                counts = pali_search.count_occurrences(pali_term)
                 sorted_counts = sorted(counts.items(), key=lambda x: -x[1])
 
-                # Show first 15 results
-                for sutta_uid, count in sorted_counts[:15]:
-                    st.write(f"**{sutta_uid}**: {count} occurrence{'s' if count != 1 else ''}")
-
-                # Show remaining results in expander
-                if len(sorted_counts) > 15:
-                    remaining = sorted_counts[15:]
-                    with st.expander(f"View all {len(sorted_counts)} suttas (+{len(remaining)} more)"):
-                        for sutta_uid, count in remaining:
-                            st.write(f"**{sutta_uid}**: {count} occurrence{'s' if count != 1 else ''}")
+                # One scrollable table instead of an element per sutta
+                st.dataframe(
+                    pd.DataFrame(sorted_counts, columns=["Sutta", "Occurrences"]),
+                    hide_index=True,
+                    use_container_width=True,
+                )
 
                 # Show sample matches
                 with st.expander("View Sample Matches"):
@@ -185,12 +330,6 @@ def render_pali_tools():
         st.subheader("Pali-English Dictionary")
         st.caption("Look up Pali terms and their meanings")
 
-        # Ensure dictionary is loaded
-        if not st.session_state.pali_dict.is_loaded():
-            with st.spinner("Loading dictionary..."):
-                st.session_state.pali_dict.load()
-            st.caption(f"Dictionary loaded: {st.session_state.pali_dict.get_entry_count():,} entries")
-
         dict_term = st.text_input(
             "Enter Pali term:",
             placeholder="e.g., bodhi, nibbāna, saṅkhāra",
@@ -198,14 +337,17 @@ def render_pali_tools():
         )
 
         if dict_term:
+            # Dictionaries are only loaded once a term is looked up
+            pali_dict = get_pali_dict()
+
             # Try direct lookup first
-            entry = st.session_state.pali_dict.lookup(dict_term)
+            entry = pali_dict.lookup(dict_term)
 
             if entry:
                 st.markdown(entry.format())
             else:
                 # Search for similar terms
-                results = st.session_state.pali_dict.search(dict_term, limit=10)
+                results = pali_dict.search(dict_term, limit=10)
                 if results:
                     st.warning(f"No exact match for '{dict_term}'. Similar terms:")
                     for r in results:
@@ -218,14 +360,6 @@ def render_pali_tools():
         st.subheader("English-Pali Dictionary")
         st.caption("Find Pali terms for English words")
 
-        # Ensure dictionary is loaded
-        if not st.session_state.eng_pali_dict.is_loaded():
-            with st.spinner("Building reverse index from Pali dictionary..."):
-                st.session_state.eng_pali_dict.load()
-            st.caption(
-                f"Index built: {st.session_state.eng_pali_dict.get_word_count():,} English words"
-            )
-
         eng_term = st.text_input(
             "Enter English word:",
             placeholder="e.g., suffering, mindfulness, enlightenment",
@@ -233,32 +367,29 @@ def render_pali_tools():
         )
 
         if eng_term:
+            eng_pali_dict = get_eng_pali()
+
             # Try direct lookup first
-            entry = st.session_state.eng_pali_dict.lookup(eng_term)
+            entry = eng_pali_dict.lookup(eng_term)
 
             if entry:
                 st.success(f"Found {len(entry.pali_terms)} Pali terms for '{eng_term}'")
                 for i, item in enumerate(entry.pali_terms, 1):
-                    term = item["term"]
-                    defn = item.get("definition", "")
-                    grammar = item.get("grammar", "")
-
-                    # Clean HTML from definition
-                    import re
-                    clean_defn = re.sub(r'<[^>]+>', '', defn)
+                    term = item.term
+                    grammar = item.grammar
 
                     with st.expander(f"{i}. {term}" + (f" ({grammar})" if grammar else "")):
                         st.markdown(f"**{term}**")
-                        st.write(clean_defn[:500] if len(clean_defn) > 500 else clean_defn)
+                        st.write(item.clean_definition)
             else:
                 # Search for similar terms
-                results = st.session_state.eng_pali_dict.search(eng_term, limit=10)
+                results = eng_pali_dict.search(eng_term, limit=10)
                 if results:
                     st.warning(f"No exact match for '{eng_term}'. Similar words:")
                     for r in results:
                         with st.expander(f"{r.english_word} ({len(r.pali_terms)} Pali terms)"):
                             for item in r.pali_terms[:5]:
-                                st.write(f"• **{item['term']}**")
+                                st.write(f"• **{item.term}**")
                 else:
                     st.error(f"No entries found for '{eng_term}'")
 
@@ -266,15 +397,6 @@ def render_pali_tools():
         st.subheader("Dictionary of Pali Proper Names (DPPN)")
         st.caption("Look up people, places, and concepts in the Pali Canon")
 
-        # Ensure dictionary is loaded
-        if not st.session_state.dppn_dict.is_loaded():
-            with st.spinner("Loading DPPN dictionary..."):
-                st.session_state.dppn_dict.load()
-            entry_count = st.session_state.dppn_dict.get_entry_count()
-            types = st.session_state.dppn_dict.get_types()
-            type_summary = ", ".join(f"{k}: {v}" for k, v in sorted(types.items()))
-            st.caption(f"DPPN loaded: {entry_count:,} entries ({type_summary})")
-
         dppn_term = st.text_input(
             "Enter name:",
             placeholder="e.g., Sāriputta, Rājagaha, Vesālī",
@@ -282,8 +404,10 @@ def render_pali_tools():
         )
 
         if dppn_term:
+            dppn_dict = get_dppn()
+
             # Try direct lookup first
-            entry = st.session_state.dppn_dict.lookup(dppn_term)
+            entry = dppn_dict.lookup(dppn_term)
 
             if entry:
                 st.markdown(entry.format())
@@ -296,7 +420,7 @@ def render_pali_tools():
                             st.write(f"• [{ref}](https://suttacentral.net/{ref})")
             else:
                 # Search for similar terms
-                results = st.session_state.dppn_dict.search(dppn_term, limit=10)
+                results = dppn_dict.search(dppn_term, limit=10)
                 if results:
                     st.warning(f"No exact match for '{dppn_term}'. Similar names:")
                     for r in results:
@@ -307,6 +431,7 @@ def render_pali_tools():
                     st.error(f"No entries found for '{dppn_term}'")
 
 
+@st.fragment
 def render_search():
     """Render the sutta search interface."""
     st.header("Search Suttas 🔍")
@@ -331,8 +456,16 @@ def render_search():
         )
 
     if query:
-        with st.spinner(f"Searching {top_k} passages..."):
-            results = st.session_state.sutta_search.search(query, top_k=top_k)
+        # Selecting a result row reruns this fragment, so keep the last
+        # results instead of embedding and retrieving the query again
+        search_key = (query, top_k)
+        last_search = st.session_state.get("sutta_search_results")
+        if last_search is not None and last_search[0] == search_key:
+            results = last_search[1]
+        else:
+            with st.spinner(f"Searching {top_k} passages..."):
+                results = get_sutta_search().search(query, top_k=top_k)
+            st.session_state.sutta_search_results = (search_key, results)
 
         if results.sutta_count == 0:
             st.warning("No matching suttas found. Try different search terms.")
@@ -340,30 +473,51 @@ def render_search():
             # Summary
             st.success(f"Found **{results.sutta_count} suttas** ({results.total_chunks} matching passages)")
 
-            # Results grouped by sutta
-            for i, sutta in enumerate(results.results):
-                # Show first 20 without expander, rest in "Show more"
-                if i < 20:
-                    with st.expander(
-                        f"**{sutta.sutta_uid}** - {sutta.title} "
-                        f"(score: {sutta.best_score:.3f}, {sutta.match_count} matches)"
-                    ):
-                        for snippet in sutta.snippets:
-                            st.markdown(f"*{snippet['segment_range']}* (score: {snippet['score']:.3f})")
-                            st.text(snippet["text"])
-                            st.divider()
-
-            # Show remaining results
-            if results.sutta_count > 20:
-                remaining = results.results[20:]
-                with st.expander(f"Show {len(remaining)} more suttas..."):
-                    for sutta in remaining:
-                        st.markdown(
-                            f"**{sutta.sutta_uid}** - {sutta.title} "
-                            f"(score: {sutta.best_score:.3f}, {sutta.match_count} matches)"
-                        )
+            # Results grouped by sutta, as one table rather than a widget per
+            # sutta; snippets are only rendered for the selected row
+            table = pd.DataFrame(
+                [
+                    {
+                        "Sutta": sutta.sutta_uid,
+                        "Title": sutta.title,
+                        "Score": sutta.best_score,
+                        "Matches": sutta.match_count,
+                    }
+                    for sutta in results.results
+                ]
+            )
+            event = st.dataframe(
+                table,
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                column_config={"Score": st.column_config.NumberColumn(format="%.3f")},
+            )
+
+            selected_rows = event.selection.rows
+            if selected_rows:
+                sutta = results.results[selected_rows[0]]
+                st.subheader(f"{sutta.sutta_uid} - {sutta.title}")
+                for snippet in sutta.snippets:
+                    st.markdown(f"*{snippet['segment_range']}* (score: {snippet['score']:.3f})")
+                    st.text(snippet["text"])
+                    st.divider()
+            else:
+                st.caption("Select a sutta to view its matching passages")
+
+
+def format_citations(citations: list[dict]) -> str:
+    """Format chat citations as a single markdown block."""
+    return "\n\n---\n\n".join(
+        f"**{i}. {c['title']}** ({c['sutta_uid']}: {c['segment_range']})\n\n"
+        f"*Score: {c['score']:.3f}*\n\n"
+        f"```\n{c['text']}\n```"
+        for i, c in enumerate(citations, 1)
+    )
 
 
+@st.fragment
 def render_chat():
     """Render the chat interface."""
     st.header("Ask the Agent 💬")
@@ -379,15 +533,11 @@ def render_chat():
                 if message.get("from_memory"):
                     st.caption("📚 Recalled from memory")
 
-                # Show sources in expander
+                # Show sources in expander (formatted when the message was added)
                 citations = message.get("citations", [])
                 if citations:
                     with st.expander(f"View Sources ({len(citations)})"):
-                        for i, c in enumerate(citations, 1):
-                            st.markdown(f"**{i}. {c['title']}** ({c['sutta_uid']}: {c['segment_range']})")
-                            st.markdown(f"*Score: {c['score']:.3f}*")
-                            st.text(c["text"][:500] + "..." if len(c["text"]) > 500 else c["text"])
-                            st.divider()
+                        st.markdown(message["sources"])
 
     # Chat input
     if prompt := st.chat_input("Ask about the Sutta Pitaka..."):
@@ -398,7 +548,8 @@ def render_chat():
 
         # Generate response
         with st.chat_message("assistant"):
-            if not st.session_state.agent.is_ready():
+            agent = get_current_agent()
+            if get_document_count() == 0:
                 response_text = "No suttas have been indexed yet. Please run `python ingest.py --nikaya mn` first."
                 st.markdown(response_text)
                 st.session_state.messages.append({
@@ -410,38 +561,47 @@ def render_chat():
                 # Create progress placeholder
                 progress_placeholder = st.empty()
 
+                @throttle_progress
                 def update_progress(progress: AgentProgress):
                     """Update the progress display."""
-                    phase_icons = {
-                        AgentPhase.RECALL: "🧠",
-                        AgentPhase.SEARCH: "🔍",
-                        AgentPhase.ANALYZE: "📊",
-                        AgentPhase.SYNTHESIZE: "✍️",
-                        AgentPhase.LEARN: "💾",
-                        AgentPhase.COMPLETE: "✅",
-                    }
-                    icon = phase_icons.get(progress.phase, "⏳")
+                    icon = PHASE_ICONS.get(progress.phase, "⏳")
 
                     if progress.phase == AgentPhase.COMPLETE:
                         progress_placeholder.empty()
                     else:
-                        progress_placeholder.info(
+                        progress_placeholder.markdown(
                             f"{icon} {progress.message} "
                             f"(Step {progress.iteration}/{progress.max_iterations})"
                         )
 
-                # Set up progress callback
-                st.session_state.agent.set_progress_callback(update_progress)
+                final: dict[str, AgentResponse] = {}
+
+                def stream_answer() -> Iterator[str]:
+                    """Yield answer text, handling progress and the final response."""
+                    for event in iter_async(agent.aresearch(prompt)):
+                        if isinstance(event, AgentProgress):
+                            update_progress(event)
+                        elif isinstance(event, AgentResponse):
+                            final["response"] = event
+                        else:
+                            yield event
+
+                response_cache = get_response_cache()
+                model_id = st.session_state.model_id
 
                 try:
-                    result = st.session_state.agent.research(prompt)
+                    result = response_cache.get(prompt, model_id)
+                    if result is not None:
+                        st.markdown(result.answer)
+                    else:
+                        # Show answer as it is generated
+                        st.write_stream(stream_answer())
+                        result = final["response"]
+                        response_cache.put(prompt, model_id, result)
 
                     # Clear progress
                     progress_placeholder.empty()
 
-                    # Show answer
-                    st.markdown(result.answer)
-
                     # Show memory indicator
                     if result.from_memory:
                         st.caption("📚 Recalled from memory")
@@ -452,24 +612,27 @@ def render_chat():
                             "sutta_uid": c.sutta_uid,
                             "segment_range": c.segment_range,
                             "title": c.title,
-                            "text": c.text_snippet,
+                            # Truncated once here rather than on every rerun
+                            "text": (
+                                c.text_snippet[:500] + "..."
+                                if len(c.text_snippet) > 500
+                                else c.text_snippet
+                            ),
                             "score": c.score,
                         }
                         for c in result.citations
                     ]
 
+                    sources = format_citations(citations)
                     if citations:
                         with st.expander(f"View Sources ({len(citations)})"):
-                            for i, c in enumerate(citations, 1):
-                                st.markdown(f"**{i}. {c['title']}** ({c['sutta_uid']}: {c['segment_range']})")
-                                st.markdown(f"*Score: {c['score']:.3f}*")
-                                st.text(c["text"][:500] + "..." if len(c["text"]) > 500 else c["text"])
-                                st.divider()
+                            st.markdown(sources)
 
                     st.session_state.messages.append({
                         "role": "assistant",
                         "content": result.answer,
                         "citations": citations,
+                        "sources": sources,
                         "from_memory": result.from_memory,
                     })
 
@@ -504,7 +667,8 @@ def main():
         render_pali_tools()
 
     # Render sidebar
-    render_sidebar()
+    with st.sidebar:
+        render_sidebar()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ import sys
 
 from src.ingestion import SuttaCentralClient, DocumentProcessor, ProgressTracker
 from src.indexing import VectorStoreManager
+from src.dictionary import PaliTextSearch
 from src.config import NIKAYA_RANGES, ALL_NIKAYAS, KN_COLLECTIONS, ALL_COLLECTIONS
 
 
@@ -206,6 +207,13 @@ def show_status() -> None:
     print()
 
 
+def build_pali_index() -> None:
+    """Rebuild the Pali term index over all cached suttas."""
+    print("Building Pali term index...")
+    token_count = PaliTextSearch().build_index()
+    print(f"Indexed {token_count:,} distinct Pali terms\n")
+
+
 def clear_progress(collection: str) -> None:
     """Clear progress for a collection."""
     tracker = ProgressTracker()
@@ -231,6 +239,7 @@ Examples:
   python ingest.py --sutta sn12.1        # Ingest single sutta
   python ingest.py --status              # Show ingestion status
   python ingest.py --clear-progress sn   # Clear progress and start fresh
+  python ingest.py --build-pali-index    # Rebuild the Pali term search index
   python ingest.py --dry-run --nikaya sn # Preview without ingesting
         """,
     )
@@ -271,6 +280,11 @@ Examples:
         action="store_true",
         help="Show current ingestion status for all collections",
     )
+    parser.add_argument(
+        "--build-pali-index",
+        action="store_true",
+        help="Rebuild the Pali term search index from cached suttas",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -285,12 +299,16 @@ Examples:
     args = parser.parse_args()
 
     # Handle commands
+    ingested = False
     if args.status:
         show_status()
     elif args.clear_progress:
         clear_progress(args.clear_progress)
+    elif args.build_pali_index:
+        build_pali_index()
     elif args.all:
         ingest_all(clear=args.clear, dry_run=args.dry_run)
+        ingested = True
     elif args.nikaya:
         ingest_collection(
             args.nikaya,
@@ -298,6 +316,7 @@ Examples:
             dry_run=args.dry_run,
             resume=not args.no_resume,
         )
+        ingested = True
     elif args.kn:
         ingest_collection(
             args.kn,
@@ -305,11 +324,18 @@ Examples:
             dry_run=args.dry_run,
             resume=not args.no_resume,
         )
+        ingested = True
     elif args.sutta:
         ingest_single_sutta(args.sutta)
+        ingested = True
     else:
         parser.print_help()
         print("\nQuick start: python ingest.py --nikaya mn")
+        return
+
+    # Newly cached suttas make the Pali term index stale
+    if ingested and not args.dry_run:
+        build_pali_index()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Agent module for Sutta Pitaka AI agents."""
 
+from .event_loop import get_agent_loop
 from .memory import AgentMemory, WisdomEntry
 from .iterative_agent import (
     SuttaPitakaAgent,
@@ -7,6 +8,7 @@ from .iterative_agent import (
     AgentProgress,
     AgentResponse,
 )
+from .response_cache import ResponseCache
 
 __all__ = [
     # Main agent with iterative search and memory
@@ -14,6 +16,8 @@ __all__ = [
     "AgentPhase",
     "AgentProgress",
     "AgentResponse",
+    "ResponseCache",
+    "get_agent_loop",
     # Memory system
     "AgentMemory",
     "WisdomEntry",
@@ -0,0 +1,47 @@
+"""Process-wide event loop for running agent coroutines from synchronous code."""
+
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+from ..config import MAX_CONCURRENT_LLM_CALLS
+
+_lock = threading.Lock()
+_agent_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# One semaphore per event loop, since asyncio primitives can only be
+# used from the loop they are first used on
+_llm_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_agent_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared event loop that runs agent coroutines.
+
+    The loop is created once per process, together with its LLM semaphore,
+    and runs forever in a background thread. Every caller submits its work
+    to it, so one session's retrieval can proceed while another's LLM call
+    is awaiting tokens.
+    """
+    global _agent_loop
+    with _lock:
+        if _agent_loop is None:
+            loop = asyncio.new_event_loop()
+            _llm_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+            threading.Thread(
+                target=loop.run_forever, name="agent-event-loop", daemon=True
+            ).start()
+            _agent_loop = loop
+        return _agent_loop
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent LLM calls on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        semaphore = _llm_semaphores.get(loop)
+        if semaphore is None:
+            # A loop other than the agent loop, e.g. asyncio.run() in a script
+            semaphore = _llm_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+        return semaphore
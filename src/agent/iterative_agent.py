@@ -1,7 +1,8 @@
 """Iterative AI agent with memory for comprehensive Sutta Pitaka research."""
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Optional, AsyncIterator, Union
 from enum import Enum
 
 from llama_index.core import PromptTemplate
@@ -16,6 +17,7 @@ from ..config import (
 )
 from ..indexing import VectorStoreManager
 from ..retrieval.query_engine import Citation, create_llm
+from .event_loop import llm_semaphore
 from .memory import AgentMemory, WisdomEntry
 
 
@@ -183,18 +185,6 @@ Synthesized Answer:"""
         # Initialize memory if enabled
         self.memory = AgentMemory() if use_memory else None
 
-        # Progress callback
-        self._progress_callback: Optional[Callable[[AgentProgress], None]] = None
-
-    def set_progress_callback(self, callback: Callable[[AgentProgress], None]) -> None:
-        """Set a callback for progress updates."""
-        self._progress_callback = callback
-
-    def _report_progress(self, progress: AgentProgress) -> None:
-        """Report progress if callback is set."""
-        if self._progress_callback:
-            self._progress_callback(progress)
-
     def switch_model(self, model_id: str) -> None:
         """Switch to a different LLM."""
         model_config = get_model(model_id)
@@ -228,13 +218,18 @@ Synthesized Answer:"""
         """Get number of indexed document chunks."""
         return self.vector_store.get_document_count()
 
-    def _retrieve(self, query: str, top_k: int) -> list[RetrievedPassage]:
-        """Retrieve passages from the vector store."""
+    async def _aretrieve(self, query: str, top_k: int) -> list[RetrievedPassage]:
+        """Retrieve passages from the vector store in a worker thread."""
         retriever = self.vector_store.index.as_retriever(
             similarity_top_k=top_k
         )
-        nodes = retriever.retrieve(query)
+        # Query embedding and the Chroma query are blocking (its async path
+        # falls back to the sync one), so keep them off the shared loop
+        nodes = await asyncio.to_thread(retriever.retrieve, query)
+        return self._to_passages(nodes)
 
+    def _to_passages(self, nodes: list) -> list[RetrievedPassage]:
+        """Convert retrieved nodes to passages."""
         passages = []
         for node in nodes:
             metadata = node.node.metadata
@@ -272,23 +267,31 @@ Synthesized Answer:"""
             )
         return "\n".join(formatted)
 
-    def _analyze_coverage(
+    def _gap_analysis_prompt(
         self,
         query: str,
         passages: list[RetrievedPassage],
-    ) -> AnalysisResult:
-        """Analyze whether passages fully cover the query."""
+    ) -> str:
+        """Build the gap analysis prompt."""
         passages_text = self._format_passages_for_prompt(passages[:30])  # Limit for context
 
-        prompt = self.GAP_ANALYSIS_PROMPT.format(
+        return self.GAP_ANALYSIS_PROMPT.format(
             query=query,
             passages=passages_text,
         )
 
-        response = self.llm.complete(prompt)
-        response_text = str(response)
+    async def _aanalyze_coverage(
+        self,
+        query: str,
+        passages: list[RetrievedPassage],
+    ) -> AnalysisResult:
+        """Analyze whether passages fully cover the query asynchronously."""
+        async with llm_semaphore():
+            response = await self.llm.acomplete(self._gap_analysis_prompt(query, passages))
+        return self._parse_analysis(str(response))
 
-        # Parse the structured response
+    def _parse_analysis(self, response_text: str) -> AnalysisResult:
+        """Parse the structured gap analysis response."""
         is_complete = False
         gaps = []
         next_query = None
@@ -316,131 +319,152 @@ Synthesized Answer:"""
             reasoning=reasoning,
         )
 
-    def _synthesize(
+    def _synthesis_prompt(
         self,
         query: str,
         passages: list[RetrievedPassage],
     ) -> str:
-        """Synthesize a comprehensive answer from passages."""
+        """Build the synthesis prompt."""
         # Get unique suttas
         unique_suttas = set(p.sutta_uid for p in passages)
 
         passages_text = self._format_passages_for_prompt(passages[:50])  # Limit for context
 
-        prompt = self.SYNTHESIS_PROMPT.format(
+        return self.SYNTHESIS_PROMPT.format(
             query=query,
             num_passages=len(passages),
             num_suttas=len(unique_suttas),
             passages=passages_text,
         )
 
-        response = self.llm.complete(prompt)
-        return str(response)
+    async def _astream_synthesis(
+        self,
+        query: str,
+        passages: list[RetrievedPassage],
+    ) -> AsyncIterator[str]:
+        """Synthesize an answer from passages, yielding text as it is generated."""
+        async with llm_semaphore():
+            stream = await self.llm.astream_complete(self._synthesis_prompt(query, passages))
+            async for chunk in stream:
+                if chunk.delta:
+                    yield chunk.delta
+
+    def _recalled_response(self, wisdom: WisdomEntry) -> AgentResponse:
+        """Build a response from a memory hit."""
+        # Convert stored citations to Citation objects
+        citations = [
+            Citation(
+                sutta_uid=uid,
+                segment_range="",
+                title="",
+                text_snippet="",
+                score=0.0,
+            )
+            for uid in wisdom.citations
+        ]
 
-    def research(
+        return AgentResponse(
+            answer=wisdom.answer,
+            citations=citations,
+            from_memory=True,
+            iterations_used=0,
+            total_passages_retrieved=0,
+        )
+
+    async def aresearch(
         self,
         query: str,
         skip_memory: bool = False,
-    ) -> AgentResponse:
+    ) -> AsyncIterator[Union[AgentProgress, str, AgentResponse]]:
         """
-        Research a question about the Sutta Pitaka.
+        Research a question, streaming progress and the answer as they happen.
 
-        Performs iterative search with gap analysis and optionally
-        saves findings to memory.
+        Performs iterative search with gap analysis and optionally saves
+        findings to memory. Retrieval and gap analysis use the async
+        LLM/embedding APIs, blocking memory calls run in a worker thread,
+        and the final synthesis is streamed token by token.
 
         Args:
             query: The research question
             skip_memory: If True, skip memory recall (but still save to memory)
 
-        Returns:
-            AgentResponse with comprehensive answer and citations
+        Yields:
+            AgentProgress updates, chunks of answer text as they are
+            generated, and finally the complete AgentResponse
         """
         # Phase 1: Recall from memory
         if self.use_memory and self.memory and not skip_memory:
-            self._report_progress(AgentProgress(
+            yield AgentProgress(
                 phase=AgentPhase.RECALL,
                 iteration=0,
                 max_iterations=self.max_iterations,
                 message="Checking memory for previous research...",
-            ))
+            )
 
-            wisdom = self.memory.recall(query)
+            wisdom = await asyncio.to_thread(self.memory.recall, query)
             if wisdom:
-                self._report_progress(AgentProgress(
+                yield AgentProgress(
                     phase=AgentPhase.COMPLETE,
                     iteration=0,
                     max_iterations=self.max_iterations,
                     message="Found relevant previous research!",
                     found_in_memory=True,
-                ))
-
-                # Convert stored citations to Citation objects
-                citations = [
-                    Citation(
-                        sutta_uid=uid,
-                        segment_range="",
-                        title="",
-                        text_snippet="",
-                        score=0.0,
-                    )
-                    for uid in wisdom.citations
-                ]
-
-                return AgentResponse(
-                    answer=wisdom.answer,
-                    citations=citations,
-                    from_memory=True,
-                    iterations_used=0,
-                    total_passages_retrieved=0,
                 )
+                yield wisdom.answer
+                yield self._recalled_response(wisdom)
+                return
 
         # Phase 2: Initial search
-        self._report_progress(AgentProgress(
+        yield AgentProgress(
             phase=AgentPhase.SEARCH,
             iteration=1,
             max_iterations=self.max_iterations,
             message=f"Searching suttas (retrieving top {self.initial_top_k})...",
-        ))
+        )
 
-        all_passages = self._retrieve(query, self.initial_top_k)
+        all_passages = await self._aretrieve(query, self.initial_top_k)
         iterations_used = 1
 
         # Phase 3: Iterative refinement
         for i in range(2, self.max_iterations + 1):
-            self._report_progress(AgentProgress(
+            yield AgentProgress(
                 phase=AgentPhase.ANALYZE,
                 iteration=i,
                 max_iterations=self.max_iterations,
                 message=f"Analyzing coverage ({len(all_passages)} passages)...",
-            ))
+            )
 
-            analysis = self._analyze_coverage(query, all_passages)
+            analysis = await self._aanalyze_coverage(query, all_passages)
 
             if analysis.is_complete or not analysis.next_query:
                 break
 
-            self._report_progress(AgentProgress(
+            yield AgentProgress(
                 phase=AgentPhase.SEARCH,
                 iteration=i,
                 max_iterations=self.max_iterations,
                 message=f"Searching for: {analysis.next_query[:50]}...",
-            ))
+            )
 
             # Retrieve more passages with refined query
-            new_passages = self._retrieve(analysis.next_query, self.iteration_top_k)
+            new_passages = await self._aretrieve(analysis.next_query, self.iteration_top_k)
             all_passages.extend(new_passages)
             all_passages = self._deduplicate_passages(all_passages)
             iterations_used = i
 
-        # Phase 4: Synthesis
-        self._report_progress(AgentProgress(
+        # Phase 4: Synthesis (streamed)
+        yield AgentProgress(
             phase=AgentPhase.SYNTHESIZE,
             iteration=iterations_used,
             max_iterations=self.max_iterations,
             message=f"Synthesizing answer from {len(all_passages)} passages...",
-        ))
+        )
 
-        answer = self._synthesize(query, all_passages)
+        answer_parts = []
+        async for delta in self._astream_synthesis(query, all_passages):
+            answer_parts.append(delta)
+            yield delta
+        answer = "".join(answer_parts)
 
         # Convert to citations
         citations = [p.to_citation() for p in all_passages]
@@ -448,27 +472,28 @@ Synthesized Answer:"""
 
         # Phase 5: Learn (save to memory)
         if self.use_memory and self.memory:
-            self._report_progress(AgentProgress(
+            yield AgentProgress(
                 phase=AgentPhase.LEARN,
                 iteration=iterations_used,
                 max_iterations=self.max_iterations,
                 message="Saving insights to memory...",
-            ))
+            )
 
-            self.memory.save(
+            await asyncio.to_thread(
+                self.memory.save,
                 query=query,
                 answer=answer,
                 citations=cited_suttas,
             )
 
-        self._report_progress(AgentProgress(
+        yield AgentProgress(
             phase=AgentPhase.COMPLETE,
             iteration=iterations_used,
             max_iterations=self.max_iterations,
             message="Research complete!",
-        ))
+        )
 
-        return AgentResponse(
+        yield AgentResponse(
             answer=answer,
             citations=citations,
             from_memory=False,
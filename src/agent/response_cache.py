@@ -0,0 +1,73 @@
+"""In-process cache of agent responses for repeated questions."""
+
+import threading
+import time
+from typing import Optional
+
+from .iterative_agent import AgentResponse
+
+
+class ResponseCache:
+    """
+    Time-limited cache of agent responses keyed by question and model.
+
+    Unlike AgentMemory, which recalls answers to *similar* questions via
+    embeddings, this only matches identical questions, and costs a dict
+    lookup instead of an embedding call. Safe to share between threads.
+    """
+
+    def __init__(self, ttl: float = 24 * 60 * 60, max_entries: int = 500):
+        """
+        Initialize the response cache.
+
+        Args:
+            ttl: Seconds a cached response stays valid
+            max_entries: Maximum number of responses kept (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, str], tuple[float, AgentResponse]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, query: str, model_id: str) -> Optional[AgentResponse]:
+        """
+        Get a cached response.
+
+        Args:
+            query: The research question
+            model_id: ID of the model that produced the response
+
+        Returns:
+            The cached AgentResponse, or None if missing or expired
+        """
+        key = (query.strip(), model_id)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            created, response = cached
+            if time.monotonic() - created > self.ttl:
+                del self._entries[key]
+                return None
+            return response
+
+    def put(self, query: str, model_id: str, response: AgentResponse) -> None:
+        """
+        Cache a response.
+
+        Args:
+            query: The research question
+            model_id: ID of the model that produced the response
+            response: The response to cache
+        """
+        key = (query.strip(), model_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic(), response)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
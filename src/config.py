@@ -29,6 +29,9 @@ CHUNK_OVERLAP = 50
 SIMILARITY_TOP_K_LOCAL = 5   # For local models (limited context handling)
 SIMILARITY_TOP_K_CLOUD = 20  # For cloud models (better context handling)
 
+# Maximum LLM requests in flight at once, across all user sessions
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "4"))
+
 # Search mode settings (exhaustive search without LLM synthesis)
 SEARCH_TOP_K_DEFAULT = 200   # Default number of chunks to retrieve
 SEARCH_TOP_K_MAX = 500       # Maximum allowed
@@ -3,7 +3,8 @@
 from .pali_dictionary import PaliDictionary, DictionaryEntry
 from .pali_search import PaliTextSearch, PaliSearchResult, PaliMatch
 from .dppn import DPPNDictionary, DPPNEntry
-from .english_to_pali import EnglishToPaliDictionary, EnglishToPaliEntry
+from .english_to_pali import EnglishToPaliDictionary, EnglishToPaliEntry, Posting
+from .loader import load_all_dictionaries
 
 __all__ = [
     "PaliDictionary",
@@ -15,4 +16,6 @@ __all__ = [
     "DPPNEntry",
     "EnglishToPaliDictionary",
     "EnglishToPaliEntry",
+    "Posting",
+    "load_all_dictionaries",
 ]
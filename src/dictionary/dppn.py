@@ -1,17 +1,92 @@
 """Dictionary of Pali Proper Names (DPPN) using SuttaCentral data."""
 
-import json
 import re
+import sys
 from dataclasses import dataclass
+from html.parser import HTMLParser
 from pathlib import Path
 from typing import Optional
 
 import requests
 
 from ..config import CACHE_PATH
+from .json_io import JSONDecodeError, loads_json, read_json
+from .pickle_cache import load_pickle, save_pickle
+from .term_index import TermIndex
 
+# Patterns for parsing entry HTML, compiled once
+_CLASS_RE = re.compile(r"class='(\w+)'")
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SUTTA_HREF_RE = re.compile(r"href='https://suttacentral\.net/([^/']+)")
 
-@dataclass
+# Markdown emphasis markers for inline HTML tags
+_EMPHASIS = {"i": "*", "b": "**"}
+
+
+class _DPPNHtmlFormatter(HTMLParser):
+    """
+    Convert DPPN entry HTML to markdown in a single pass.
+
+    Bare <p> tags become newlines, <i> and <b> become emphasis (also inside
+    link text), sutta reference links become markdown links, and all other
+    tags are dropped.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts: list[str] = []
+        # Open emphasis markers: (output list, position of the marker)
+        self._emphasis: list[tuple[list[str], int]] = []
+        self._ref_href: Optional[str] = None
+        self._ref_text: list[str] = []
+
+    def _output(self) -> list[str]:
+        """Get the list text currently goes to (link text inside a ref)."""
+        return self._ref_text if self._ref_href is not None else self.parts
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "p":
+            # Paragraphs with attributes are dropped without a newline
+            if not attrs:
+                self.parts.append("\n")
+        elif tag in _EMPHASIS:
+            output = self._output()
+            self._emphasis.append((output, len(output)))
+            output.append(_EMPHASIS[tag])
+        elif tag == "a":
+            attrs = dict(attrs)
+            if attrs.get("class") == "ref" and attrs.get("href"):
+                self._ref_href = attrs["href"]
+                self._ref_text = []
+
+    def handle_endtag(self, tag):
+        if tag in _EMPHASIS and self._emphasis:
+            output, start = self._emphasis.pop()
+            if output is self._output() and start == len(output) - 1:
+                # Nothing was emphasized, so drop the opening marker
+                output.pop()
+            else:
+                self._output().append(_EMPHASIS[tag])
+        elif tag == "a" and self._ref_href is not None:
+            self.parts.append(f"[{''.join(self._ref_text)}]({self._ref_href})")
+            self._ref_href = None
+
+    def handle_data(self, data):
+        self._output().append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f"&{name};")
+
+    def handle_charref(self, name):
+        self.handle_data(f"&#{name};")
+
+    def markdown(self) -> str:
+        """Get the markdown for everything fed so far."""
+        self.close()
+        return "".join(self.parts)
+
+
+@dataclass(slots=True)
 class DPPNEntry:
     """A DPPN dictionary entry for a proper name."""
 
@@ -21,42 +96,26 @@ class DPPNEntry:
 
     def format(self) -> str:
         """Format entry for display (clean HTML for terminal/markdown)."""
-        # Extract entry type from HTML class if present
-        type_match = re.search(r"class='(\w+)'", self.text)
-        entry_type = type_match.group(1) if type_match else None
-
-        # Clean HTML tags but preserve structure
-        clean_text = self.text
-        # Convert <p> to newlines
-        clean_text = re.sub(r'<p>', '\n', clean_text)
-        clean_text = re.sub(r'</p>', '', clean_text)
-        # Convert <i> to markdown italic
-        clean_text = re.sub(r'<i>([^<]+)</i>', r'*\1*', clean_text)
-        # Convert <b> to markdown bold
-        clean_text = re.sub(r'<b>([^<]+)</b>', r'**\1**', clean_text)
-        # Extract sutta references
-        clean_text = re.sub(
-            r"<a class='ref' href='([^']+)'>([^<]+)</a>",
-            r'[\2](\1)',
-            clean_text
-        )
-        # Remove remaining HTML tags
-        clean_text = re.sub(r'<[^>]+>', '', clean_text)
+        # Convert HTML to markdown, preserving structure
+        formatter = _DPPNHtmlFormatter()
+        formatter.feed(self.text)
+        clean_text = formatter.markdown()
         # Clean up whitespace
-        clean_text = re.sub(r'\n\s*\n', '\n\n', clean_text)
+        clean_text = _BLANK_LINES_RE.sub('\n\n', clean_text)
         clean_text = clean_text.strip()
 
-        output = f"**{self.word}**"
-        if entry_type:
-            output += f" ({entry_type})"
-        output += f"\n\n{clean_text}"
-        return output
+        parts = [f"**{self.word}**"]
+        if self.entry_type:
+            parts.append(f" ({self.entry_type})")
+        parts.append(f"\n\n{clean_text}")
+        return "".join(parts)
 
     def get_references(self) -> list[str]:
         """Extract sutta references from the entry."""
-        # Find all sutta references in the HTML
-        refs = re.findall(r"href='https://suttacentral\.net/([^/']+)", self.text)
-        return list(set(refs))
+        # Find all sutta references in the HTML, deduplicated in page order
+        return list(dict.fromkeys(
+            m.group(1) for m in _SUTTA_HREF_RE.finditer(self.text)
+        ))
 
 
 class DPPNDictionary:
@@ -71,6 +130,9 @@ class DPPNDictionary:
     # Raw GitHub URL for the DPPN dictionary
     GITHUB_URL = "https://raw.githubusercontent.com/suttacentral/sc-data/main/dictionaries/complex/en/pli2en_dppn.json"
     CACHE_FILE = "dppn_dictionary.json"
+    # Parsed entries, so warm starts skip JSON parsing and entry construction
+    PICKLE_FILE = "dppn_dictionary.pkl"
+    PICKLE_VERSION = 2  # Bump when DPPNEntry or TermIndex changes
 
     def __init__(self, use_cache: bool = True):
         """
@@ -81,7 +143,9 @@ class DPPNDictionary:
         """
         self.use_cache = use_cache
         self.cache_path = CACHE_PATH / self.CACHE_FILE
+        self.pickle_path = CACHE_PATH / self.PICKLE_FILE
         self._entries: dict[str, DPPNEntry] = {}
+        self._term_index = TermIndex()
         self._loaded = False
 
     def _load_from_cache(self) -> bool:
@@ -89,22 +153,43 @@ class DPPNDictionary:
         if not self.use_cache or not self.cache_path.exists():
             return False
 
+        if self._load_from_pickle():
+            return True
+
         try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._parse_entries(data)
-                return True
-        except (json.JSONDecodeError, IOError):
+            self._parse_entries(read_json(self.cache_path))
+        except (JSONDecodeError, IOError):
+            return False
+
+        self._save_to_pickle()
+        return True
+
+    def _load_from_pickle(self) -> bool:
+        """Load parsed entries from the pickle cache if it is current."""
+        data = load_pickle(self.pickle_path, self.PICKLE_VERSION, self.cache_path)
+        if data is None:
             return False
 
-    def _save_to_cache(self, data: list[dict]) -> None:
-        """Save dictionary data to cache."""
+        self._entries = data["entries"]
+        self._term_index = data["term_index"]
+        return True
+
+    def _save_to_pickle(self) -> None:
+        """Save parsed entries to the pickle cache."""
+        save_pickle(
+            self.pickle_path,
+            self.PICKLE_VERSION,
+            {"entries": self._entries, "term_index": self._term_index},
+        )
+
+    def _save_to_cache(self, raw: bytes) -> None:
+        """Save the downloaded dictionary JSON to cache as-is."""
         if not self.use_cache:
             return
 
         CACHE_PATH.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+        self.cache_path.write_bytes(raw)
+        self._save_to_pickle()
 
     def _parse_entries(self, data: list[dict]) -> None:
         """Parse JSON data into DPPNEntry objects."""
@@ -115,8 +200,9 @@ class DPPNDictionary:
 
             # Extract entry type from HTML class
             text = item.get("text", "")
-            type_match = re.search(r"class='(\w+)'", text)
-            entry_type = type_match.group(1) if type_match else None
+            type_match = _CLASS_RE.search(text)
+            # Only a handful of distinct types, so share one string for each
+            entry_type = sys.intern(type_match.group(1)) if type_match else None
 
             entry = DPPNEntry(
                 word=word,
@@ -126,6 +212,8 @@ class DPPNDictionary:
             # Store with lowercase key for case-insensitive lookup
             self._entries[word.lower()] = entry
 
+        self._term_index = TermIndex(self._entries)
+
     def load(self) -> bool:
         """
         Load the dictionary (from cache or GitHub).
@@ -143,16 +231,17 @@ class DPPNDictionary:
 
         # Fetch from GitHub
         try:
+            # requests negotiates gzip; the raw body is parsed and cached
+            # without being decoded to text or re-encoded
             response = requests.get(self.GITHUB_URL, timeout=60)
             response.raise_for_status()
-            data = response.json()
 
-            self._parse_entries(data)
-            self._save_to_cache(data)
+            self._parse_entries(loads_json(response.content))
+            self._save_to_cache(response.content)
             self._loaded = True
             return True
 
-        except requests.RequestException as e:
+        except (requests.RequestException, JSONDecodeError) as e:
             print(f"Error fetching DPPN dictionary: {e}")
             return False
 
@@ -173,10 +262,7 @@ class DPPNDictionary:
         term_lower = term.lower().strip()
 
         # Direct lookup
-        if term_lower in self._entries:
-            return self._entries[term_lower]
-
-        return None
+        return self._entries.get(term_lower)
 
     def search(self, pattern: str, limit: int = 20) -> list[DPPNEntry]:
         """
@@ -193,20 +279,19 @@ class DPPNDictionary:
             self.load()
 
         results = []
+        seen: set[str] = set()
         pattern_lower = pattern.lower()
 
         # First try prefix match
-        for term, entry in self._entries.items():
-            if term.startswith(pattern_lower):
-                results.append(entry)
-                if len(results) >= limit:
-                    break
+        for term in self._term_index.prefix(pattern_lower, limit):
+            results.append(self._entries[term])
+            seen.add(term)
 
-        # If few results, try substring match
+        # If few results, try substring match (may repeat the prefix matches)
         if len(results) < limit:
-            for term, entry in self._entries.items():
-                if pattern_lower in term and entry not in results:
-                    results.append(entry)
+            for term in self._term_index.containing(pattern_lower, limit + len(seen)):
+                if term not in seen:
+                    results.append(self._entries[term])
                     if len(results) >= limit:
                         break
 
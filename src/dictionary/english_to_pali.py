@@ -1,42 +1,86 @@
 """English-to-Pali reverse dictionary built from SuttaCentral data."""
 
-import json
+import hashlib
+import pickle
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from ..config import CACHE_PATH
 from .pali_dictionary import PaliDictionary
-
-
-@dataclass
+from .term_index import TermIndex
+
+# Patterns for cleaning definitions and extracting words, compiled once
+_TAG_RE = re.compile(r'<[^>]+>')
+_BRACKET_RE = re.compile(r'\[[^\]]+\]')
+_BOLD_MD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_BOLD_HTML_RE = re.compile(r'<b>([^<]+)</b>')
+_WORD3_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_WORD4_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Common words to ignore when indexing definitions
+_STOPWORDS = frozenset({
+    # Common English words
+    'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
+    'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'this', 'that', 'these', 'those', 'it', 'its', 'with', 'from',
+    'for', 'on', 'of', 'to', 'in', 'at', 'by', 'as', 'into', 'onto',
+    'upon', 'about', 'after', 'before', 'between', 'through', 'during',
+    'under', 'over', 'above', 'below', 'up', 'down', 'out', 'off',
+    'away', 'back', 'here', 'there', 'where', 'when', 'how', 'why',
+    'what', 'which', 'who', 'whom', 'whose', 'than', 'then', 'so',
+    'very', 'just', 'only', 'also', 'even', 'still', 'already', 'yet',
+    'now', 'always', 'never', 'often', 'sometimes', 'usually',
+    'not', 'no', 'yes', 'all', 'any', 'some', 'each', 'every', 'both',
+    'few', 'more', 'most', 'other', 'another', 'such', 'same',
+    'one', 'two', 'three', 'four', 'five', 'first', 'second', 'third',
+    # Grammar terms
+    'noun', 'verb', 'adj', 'adv', 'prep', 'conj', 'pron', 'masc',
+    'fem', 'neut', 'sing', 'plur', 'nom', 'acc', 'gen', 'dat', 'inst',
+    'abl', 'loc', 'voc', 'pres', 'past', 'fut', 'perf', 'imper',
+    'part', 'inf', 'ger', 'caus', 'pass', 'act', 'mid', 'opt',
+    'indic', 'subj', 'cond', 'abs', 'stem', 'root', 'prefix', 'suffix',
+    'lit', 'literally', 'see', 'also', 'comm', 'commentary',
+    # Common Pali grammar abbreviations
+    'pp', 'prp', 'fpp', 'ptp', 'nt', 'mfn',
+})
+
+
+class Posting(NamedTuple):
+    """A Pali term matching an English word, with the definition it came from."""
+
+    term: str
+    definition: str
+    grammar: Optional[str]
+    clean_definition: str  # HTML stripped, max 500 chars
+
+
+@dataclass(slots=True)
 class EnglishToPaliEntry:
     """An English word with its Pali equivalents."""
 
     english_word: str
-    pali_terms: list[dict] = field(default_factory=list)
-    # Each dict has: {term: str, definition: str, grammar: str|None}
+    pali_terms: list[Posting] = field(default_factory=list)
 
     def format(self) -> str:
         """Format entry for display."""
-        output = f"**{self.english_word}**\n\n"
+        parts = [f"**{self.english_word}**\n\n"]
         for i, item in enumerate(self.pali_terms, 1):
-            term = item["term"]
-            defn = item.get("definition", "")
-            grammar = item.get("grammar", "")
-
-            output += f"{i}. **{term}**"
-            if grammar:
-                output += f" ({grammar})"
-            if defn:
-                # Clean HTML and truncate long definitions
-                clean_defn = re.sub(r'<[^>]+>', '', defn)
+            clean_defn = item.clean_definition
+
+            parts.append(f"{i}. **{item.term}**")
+            if item.grammar:
+                parts.append(f" ({item.grammar})")
+            if clean_defn:
+                # Truncate long definitions
                 if len(clean_defn) > 150:
                     clean_defn = clean_defn[:150] + "..."
-                output += f"\n   {clean_defn}"
-            output += "\n"
-        return output
+                parts.append(f"\n   {clean_defn}")
+            parts.append("\n")
+        return "".join(parts)
 
 
 class EnglishToPaliDictionary:
@@ -48,41 +92,78 @@ class EnglishToPaliDictionary:
     definitions and maps them back to their Pali terms.
     """
 
-    CACHE_FILE = "english_to_pali_index.json"
-
-    def __init__(self, use_cache: bool = True):
+    # The cache file name includes a hash of the size and mtime of the Pali
+    # dictionary cache it was built from, so the index is rebuilt whenever
+    # the source dictionary changes
+    CACHE_FILE = "english_to_pali_index.{digest}.pkl"
+    INDEX_VERSION = 2  # Bump when the index format changes
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+        pali_dict: Optional[PaliDictionary] = None,
+    ):
         """
         Initialize the English-to-Pali dictionary.
 
         Args:
             use_cache: Whether to cache the reverse index locally
+            pali_dict: Pali dictionary to build from. If None, creates a new one.
         """
         self.use_cache = use_cache
-        self.cache_path = CACHE_PATH / self.CACHE_FILE
-        self._index: dict[str, list[dict]] = {}
+        self._index: dict[str, list[Posting]] = {}
+        self._term_index = TermIndex()
         self._loaded = False
-        self._pali_dict = PaliDictionary(use_cache=use_cache)
+        self._pali_dict = pali_dict or PaliDictionary(use_cache=use_cache)
+        # Set by load() once the Pali dictionary cache file is known
+        self.cache_path: Optional[Path] = None
+
+    def _index_cache_path(self) -> Optional[Path]:
+        """Path of the cached index for the current Pali dictionary, if known."""
+        try:
+            source_stat = self._pali_dict.cache_path.stat()
+        except OSError:
+            return None
+
+        key = f"{self.INDEX_VERSION}:{source_stat.st_size}:{source_stat.st_mtime_ns}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return CACHE_PATH / self.CACHE_FILE.format(digest=digest)
 
     def _load_from_cache(self) -> bool:
         """Load reverse index from cache if available."""
-        if not self.use_cache or not self.cache_path.exists():
+        if not self.use_cache:
+            return False
+
+        if self.cache_path is None or not self.cache_path.exists():
             return False
 
         try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                self._index = json.load(f)
+            with open(self.cache_path, "rb") as f:
+                self._index = pickle.load(f)
                 return True
-        except (json.JSONDecodeError, IOError):
+        except (pickle.UnpicklingError, EOFError, AttributeError, IOError):
             return False
 
     def _save_to_cache(self) -> None:
-        """Save reverse index to cache."""
+        """Save reverse index to cache, removing indexes of older sources."""
         if not self.use_cache:
             return
 
+        if self.cache_path is None:
+            return
+
         CACHE_PATH.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, "w", encoding="utf-8") as f:
-            json.dump(self._index, f, ensure_ascii=False)
+        with open(self.cache_path, "wb") as f:
+            pickle.dump(self._index, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        for stale_path in CACHE_PATH.glob(self.CACHE_FILE.format(digest="*")):
+            if stale_path != self.cache_path:
+                stale_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _clean_definition(definition: str) -> str:
+        """Strip HTML from a definition and truncate it for display."""
+        return _TAG_RE.sub('', definition)[:500]
 
     def _extract_english_words(self, definition: str) -> list[str]:
         """
@@ -95,64 +176,31 @@ class EnglishToPaliDictionary:
             List of extracted English words
         """
         # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', ' ', definition)
+        clean = _TAG_RE.sub(' ', definition)
 
         # Remove grammatical notation in brackets
-        clean = re.sub(r'\[[^\]]+\]', '', clean)
+        clean = _BRACKET_RE.sub('', clean)
 
-        # Extract text in bold (usually the main translation)
-        bold_matches = re.findall(r'\*\*([^*]+)\*\*', definition)
-        bold_text = ' '.join(bold_matches)
-
-        # Also extract from <b> tags
-        b_matches = re.findall(r'<b>([^<]+)</b>', definition)
-        bold_text += ' ' + ' '.join(b_matches)
+        # Extract text in bold (usually the main translation),
+        # from both markdown and <b> tags
+        bold_text = ' '.join(
+            _BOLD_MD_RE.findall(definition) + _BOLD_HTML_RE.findall(definition)
+        )
 
         # Process the bold text first (these are the primary meanings)
-        words = set()
-
-        # Extract words from bold text
-        for word in re.findall(r'\b[a-zA-Z]{3,}\b', bold_text.lower()):
-            if not self._is_stopword(word):
-                words.add(word)
+        words = {
+            word for word in _WORD3_RE.findall(bold_text.lower())
+            if word not in _STOPWORDS
+        }
 
         # Also extract from the full cleaned text, but be more selective
-        for word in re.findall(r'\b[a-zA-Z]{4,}\b', clean.lower()):
-            if not self._is_stopword(word):
-                words.add(word)
+        words.update(
+            word for word in _WORD4_RE.findall(clean.lower())
+            if word not in _STOPWORDS
+        )
 
         return list(words)
 
-    def _is_stopword(self, word: str) -> bool:
-        """Check if a word is a stopword (common word to ignore)."""
-        stopwords = {
-            # Common English words
-            'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
-            'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
-            'will', 'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-            'this', 'that', 'these', 'those', 'it', 'its', 'with', 'from',
-            'for', 'on', 'of', 'to', 'in', 'at', 'by', 'as', 'into', 'onto',
-            'upon', 'about', 'after', 'before', 'between', 'through', 'during',
-            'under', 'over', 'above', 'below', 'up', 'down', 'out', 'off',
-            'away', 'back', 'here', 'there', 'where', 'when', 'how', 'why',
-            'what', 'which', 'who', 'whom', 'whose', 'than', 'then', 'so',
-            'very', 'just', 'only', 'also', 'even', 'still', 'already', 'yet',
-            'now', 'always', 'never', 'often', 'sometimes', 'usually',
-            'not', 'no', 'yes', 'all', 'any', 'some', 'each', 'every', 'both',
-            'few', 'more', 'most', 'other', 'another', 'such', 'same',
-            'one', 'two', 'three', 'four', 'five', 'first', 'second', 'third',
-            # Grammar terms
-            'noun', 'verb', 'adj', 'adv', 'prep', 'conj', 'pron', 'masc',
-            'fem', 'neut', 'sing', 'plur', 'nom', 'acc', 'gen', 'dat', 'inst',
-            'abl', 'loc', 'voc', 'pres', 'past', 'fut', 'perf', 'imper',
-            'part', 'inf', 'ger', 'caus', 'pass', 'act', 'mid', 'opt',
-            'indic', 'subj', 'cond', 'abs', 'stem', 'root', 'prefix', 'suffix',
-            'lit', 'literally', 'see', 'also', 'comm', 'commentary',
-            # Common Pali grammar abbreviations
-            'pp', 'prp', 'fpp', 'ptp', 'nt', 'mfn',
-        }
-        return word in stopwords
-
     def _build_index(self) -> None:
         """Build the reverse index from the Pali-English dictionary."""
         # Ensure Pali dictionary is loaded
@@ -160,26 +208,30 @@ class EnglishToPaliDictionary:
             return
 
         # Build reverse index
-        for term, entry in self._pali_dict._entries.items():
-            for definition in entry.definitions:
-                words = self._extract_english_words(definition)
+        index: dict[str, list[Posting]] = defaultdict(list)
+        # Many definitions repeat across entries, so process each text once
+        processed: dict[str, tuple[list[str], str]] = {}
+        for term, definitions, grammar in self._pali_dict.iter_term_defs():
+            for definition in definitions:
+                cached = processed.get(definition)
+                if cached is None:
+                    cached = processed[definition] = (
+                        self._extract_english_words(definition),
+                        self._clean_definition(definition),
+                    )
+                words, clean_definition = cached
+
+                # One posting per definition, shared by all of its words
+                posting = Posting(term, definition, grammar, clean_definition)
+                # Add this Pali term as a match for each English word
                 for word in words:
-                    if word not in self._index:
-                        self._index[word] = []
-
-                    # Add this Pali term as a match for the English word
-                    self._index[word].append({
-                        "term": entry.term,
-                        "definition": definition,
-                        "grammar": entry.grammar,
-                    })
-
-        # Sort entries by term for consistency
-        for word in self._index:
-            self._index[word] = sorted(
-                self._index[word],
-                key=lambda x: x["term"]
-            )[:50]  # Limit to 50 Pali terms per English word
+                    index[word].append(posting)
+
+        # Sort entries by term for consistency, limited to 50 Pali terms per word
+        self._index = {
+            word: sorted(postings, key=lambda x: x.term)[:50]
+            for word, postings in index.items()
+        }
 
     def load(self) -> bool:
         """
@@ -192,14 +244,19 @@ class EnglishToPaliDictionary:
             return True
 
         # Try cache first
+        self.cache_path = self._index_cache_path()
         if self._load_from_cache():
+            self._term_index = TermIndex(self._index)
             self._loaded = True
             return True
 
         # Build from Pali dictionary
         self._build_index()
         if self._index:
+            # Building may have downloaded the Pali dictionary cache file
+            self.cache_path = self._index_cache_path()
             self._save_to_cache()
+            self._term_index = TermIndex(self._index)
             self._loaded = True
             return True
 
@@ -220,10 +277,11 @@ class EnglishToPaliDictionary:
 
         word = english_word.lower().strip()
 
-        if word in self._index:
+        pali_terms = self._index.get(word)
+        if pali_terms is not None:
             return EnglishToPaliEntry(
                 english_word=word,
-                pali_terms=self._index[word]
+                pali_terms=pali_terms
             )
 
         return None
@@ -243,30 +301,27 @@ class EnglishToPaliDictionary:
             self.load()
 
         results = []
+        seen: set[str] = set()
         pattern_lower = pattern.lower()
 
         # First try prefix match
-        for word in sorted(self._index.keys()):
-            if word.startswith(pattern_lower):
-                results.append(EnglishToPaliEntry(
-                    english_word=word,
-                    pali_terms=self._index[word]
-                ))
-                if len(results) >= limit:
-                    break
-
-        # If few results, try substring match
+        for word in self._term_index.prefix(pattern_lower, limit):
+            results.append(EnglishToPaliEntry(
+                english_word=word,
+                pali_terms=self._index[word]
+            ))
+            seen.add(word)
+
+        # If few results, try substring match (may repeat the prefix matches)
         if len(results) < limit:
-            for word in sorted(self._index.keys()):
-                if pattern_lower in word:
-                    entry = EnglishToPaliEntry(
+            for word in self._term_index.containing(pattern_lower, limit + len(seen)):
+                if word not in seen:
+                    results.append(EnglishToPaliEntry(
                         english_word=word,
                         pali_terms=self._index[word]
-                    )
-                    if entry not in results:
-                        results.append(entry)
-                        if len(results) >= limit:
-                            break
+                    ))
+                    if len(results) >= limit:
+                        break
 
         return results
 
@@ -0,0 +1,25 @@
+"""JSON parsing helpers for the dictionary caches, using orjson when installed."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON from raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return loads_json(path.read_bytes())
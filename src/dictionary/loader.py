@@ -0,0 +1,44 @@
+"""Concurrent loading of the Pali dictionaries."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .dppn import DPPNDictionary
+from .english_to_pali import EnglishToPaliDictionary
+from .pali_dictionary import PaliDictionary
+
+
+def load_all_dictionaries(
+    use_cache: bool = True,
+) -> tuple[PaliDictionary, DPPNDictionary, EnglishToPaliDictionary]:
+    """
+    Load the Pali-English, DPPN and English-Pali dictionaries.
+
+    The DPPN is fetched/parsed in parallel with the Pali-English dictionary,
+    so a cold start takes roughly as long as the slower of the two rather
+    than their sum. The English-Pali index is built from (and shares) the
+    loaded Pali-English dictionary.
+
+    Use this to prewarm every dictionary cache at once (e.g. from a
+    script); the app loads each dictionary on demand instead.
+
+    Args:
+        use_cache: Whether to use the local dictionary caches
+
+    Returns:
+        Tuple of (pali_dict, dppn, eng_pali)
+    """
+    pali_dict = PaliDictionary(use_cache=use_cache)
+    dppn = DPPNDictionary(use_cache=use_cache)
+    eng_pali = EnglishToPaliDictionary(use_cache=use_cache, pali_dict=pali_dict)
+
+    def load_pali() -> None:
+        # The reverse index needs the Pali dictionary, so load them in order
+        pali_dict.load()
+        eng_pali.load()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(load_pali), executor.submit(dppn.load)]
+        for future in futures:
+            future.result()
+
+    return pali_dict, dppn, eng_pali
@@ -1,17 +1,22 @@
 """Pali-English dictionary using SuttaCentral data."""
 
-import json
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import requests
 
 from ..config import CACHE_PATH
+from .json_io import JSONDecodeError, loads_json, read_json
+from .pickle_cache import load_pickle, save_pickle
+from .term_index import TermIndex
 
+_TAG_RE = re.compile(r'<[^>]+>')
 
-@dataclass
+
+@dataclass(slots=True)
 class DictionaryEntry:
     """A Pali dictionary entry."""
 
@@ -23,15 +28,16 @@ class DictionaryEntry:
 
     def format(self) -> str:
         """Format entry for display."""
-        output = f"**{self.term}**"
+        parts = [f"**{self.term}**"]
         if self.grammar:
-            output += f" ({self.grammar})"
-        output += "\n"
-        for i, defn in enumerate(self.definitions, 1):
-            # Clean HTML tags from definitions
-            clean_defn = re.sub(r'<[^>]+>', '', defn)
-            output += f"  {i}. {clean_defn}\n"
-        return output
+            parts.append(f" ({self.grammar})")
+        parts.append("\n")
+        # Clean HTML tags from definitions
+        parts.extend(
+            f"  {i}. {_TAG_RE.sub('', defn)}\n"
+            for i, defn in enumerate(self.definitions, 1)
+        )
+        return "".join(parts)
 
 
 class PaliDictionary:
@@ -44,6 +50,9 @@ class PaliDictionary:
 
     API_URL = "https://suttacentral.net/api/dictionaries/lookup?from=pli&to=en"
     CACHE_FILE = "pali_dictionary.json"
+    # Parsed entries, so warm starts skip JSON parsing and entry construction
+    PICKLE_FILE = "pali_dictionary.pkl"
+    PICKLE_VERSION = 2  # Bump when DictionaryEntry or TermIndex changes
 
     def __init__(self, use_cache: bool = True):
         """
@@ -54,7 +63,9 @@ class PaliDictionary:
         """
         self.use_cache = use_cache
         self.cache_path = CACHE_PATH / self.CACHE_FILE
+        self.pickle_path = CACHE_PATH / self.PICKLE_FILE
         self._entries: dict[str, DictionaryEntry] = {}
+        self._term_index = TermIndex()
         self._loaded = False
 
     def _load_from_cache(self) -> bool:
@@ -62,22 +73,43 @@ class PaliDictionary:
         if not self.use_cache or not self.cache_path.exists():
             return False
 
+        if self._load_from_pickle():
+            return True
+
         try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._parse_entries(data)
-                return True
-        except (json.JSONDecodeError, IOError):
+            self._parse_entries(read_json(self.cache_path))
+        except (JSONDecodeError, IOError):
             return False
 
-    def _save_to_cache(self, data: list[dict]) -> None:
-        """Save dictionary data to cache."""
+        self._save_to_pickle()
+        return True
+
+    def _load_from_pickle(self) -> bool:
+        """Load parsed entries from the pickle cache if it is current."""
+        data = load_pickle(self.pickle_path, self.PICKLE_VERSION, self.cache_path)
+        if data is None:
+            return False
+
+        self._entries = data["entries"]
+        self._term_index = data["term_index"]
+        return True
+
+    def _save_to_pickle(self) -> None:
+        """Save parsed entries to the pickle cache."""
+        save_pickle(
+            self.pickle_path,
+            self.PICKLE_VERSION,
+            {"entries": self._entries, "term_index": self._term_index},
+        )
+
+    def _save_to_cache(self, raw: bytes) -> None:
+        """Save the downloaded dictionary JSON to cache as-is."""
         if not self.use_cache:
             return
 
         CACHE_PATH.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+        self.cache_path.write_bytes(raw)
+        self._save_to_pickle()
 
     def _parse_entries(self, data: list[dict]) -> None:
         """Parse API response into DictionaryEntry objects."""
@@ -86,15 +118,24 @@ class PaliDictionary:
             if not term:
                 continue
 
+            # Intern the term (shared by the key, the entry and the reverse
+            # index) and grammar (a few dozen distinct values)
+            term = sys.intern(term)
+            grammar = item.get("grammar")
+            if grammar:
+                grammar = sys.intern(grammar)
+
             entry = DictionaryEntry(
                 term=term,
                 definitions=item.get("definition", []),
-                grammar=item.get("grammar"),
+                grammar=grammar,
                 pronunciation=item.get("pronunciation"),
                 cross_references=item.get("xr"),
             )
             self._entries[term] = entry
 
+        self._term_index = TermIndex(self._entries)
+
     def load(self) -> bool:
         """
         Load the dictionary (from cache or API).
@@ -112,16 +153,17 @@ class PaliDictionary:
 
         # Fetch from API
         try:
+            # requests negotiates gzip; the raw body is parsed and cached
+            # without being decoded to text or re-encoded
             response = requests.get(self.API_URL, timeout=60)
             response.raise_for_status()
-            data = response.json()
 
-            self._parse_entries(data)
-            self._save_to_cache(data)
+            self._parse_entries(loads_json(response.content))
+            self._save_to_cache(response.content)
             self._loaded = True
             return True
 
-        except requests.RequestException as e:
+        except (requests.RequestException, JSONDecodeError) as e:
             print(f"Error fetching dictionary: {e}")
             return False
 
@@ -142,8 +184,9 @@ class PaliDictionary:
         term = term.lower().strip()
 
         # Direct lookup
-        if term in self._entries:
-            return self._entries[term]
+        entry = self._entries.get(term)
+        if entry is not None:
+            return entry
 
         # Try without diacritics variations
         # Common substitutions: ā->a, ī->i, ū->u, ṁ->m, ṅ->n, ñ->n, ṭ->t, ḍ->d, ṇ->n, ḷ->l
@@ -164,25 +207,37 @@ class PaliDictionary:
             self.load()
 
         results = []
+        seen: set[str] = set()
         pattern_lower = pattern.lower()
 
         # First try prefix match
-        for term, entry in self._entries.items():
-            if term.startswith(pattern_lower):
-                results.append(entry)
-                if len(results) >= limit:
-                    break
+        for term in self._term_index.prefix(pattern_lower, limit):
+            results.append(self._entries[term])
+            seen.add(term)
 
-        # If few results, try substring match
+        # If few results, try substring match (may repeat the prefix matches)
         if len(results) < limit:
-            for term, entry in self._entries.items():
-                if pattern_lower in term and entry not in results:
-                    results.append(entry)
+            for term in self._term_index.containing(pattern_lower, limit + len(seen)):
+                if term not in seen:
+                    results.append(self._entries[term])
                     if len(results) >= limit:
                         break
 
         return results
 
+    def iter_term_defs(self) -> Iterator[tuple[str, list[str], Optional[str]]]:
+        """
+        Iterate over the fields needed to index definitions.
+
+        Yields:
+            (term, definitions, grammar) for each entry
+        """
+        if not self._loaded:
+            self.load()
+
+        for entry in self._entries.values():
+            yield entry.term, entry.definitions, entry.grammar
+
     def get_entry_count(self) -> int:
         """Get the number of dictionary entries."""
         if not self._loaded:
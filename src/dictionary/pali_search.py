@@ -1,12 +1,57 @@
 """Pali text search across cached suttas."""
 
-import json
+import os
+import pickle
 import re
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, NamedTuple, Optional
 
 from ..config import CACHE_PATH
+from .json_io import JSONDecodeError, read_json
+
+# Pali tokens for the inverted index (\w matches diacritics like ā, ṁ, ñ)
+_TOKEN_RE = re.compile(r"\w+")
+
+# Joins all segments into one buffer for scanning. It never occurs in the
+# text, and as a non-word character it keeps \b boundaries per segment.
+_SEGMENT_SEP = "\x1f"
+
+
+@lru_cache(maxsize=256)
+def _get_pattern(term: str, case_sensitive: bool, whole_word: bool) -> re.Pattern:
+    """Get the compiled regex for a search, reused across repeated searches."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    escaped = re.escape(term)
+    if whole_word and _TOKEN_RE.match(term):
+        # Same as \b{term}\b, but with the leading boundary checked after the
+        # literal, so the regex engine can still skip ahead to the term
+        return re.compile(rf'{escaped}(?<!\w{escaped})\b', flags)
+    if whole_word:
+        return re.compile(rf'\b{escaped}\b', flags)
+    return re.compile(escaped, flags)
+
+
+class _Corpus(NamedTuple):
+    """
+    The searchable Pali text of all cached suttas.
+
+    Segments are numbered across the whole cache in search order, as in
+    the inverted index.
+    """
+
+    files: list[str]  # cache file names, for loading translations of matches
+    uids: list[str]
+    sutta_starts: array  # number of each sutta's first segment
+    seg_ids: list[str]
+    seg_starts: array  # offset of each segment in text
+    text: str  # all segments joined by _SEGMENT_SEP
 
 
 @dataclass
@@ -42,10 +87,8 @@ class PaliSearchResult:
         output = self.format_summary() + "\n\n"
 
         # Group by sutta
-        by_sutta: dict[str, list[PaliMatch]] = {}
+        by_sutta: dict[str, list[PaliMatch]] = defaultdict(list)
         for match in self.matches:
-            if match.sutta_uid not in by_sutta:
-                by_sutta[match.sutta_uid] = []
             by_sutta[match.sutta_uid].append(match)
 
         for sutta_uid, matches in sorted(by_sutta.items()):
@@ -61,8 +104,17 @@ class PaliTextSearch:
 
     This searches the raw Pali root text from cached SuttaCentral data,
     allowing researchers to find occurrences of specific Pali terms.
+
+    Case-insensitive searches for a single word are answered from an
+    inverted index when one has been built (see build_index); other
+    searches scan the Pali text of the cached suttas, which is kept in
+    memory after the first scan.
     """
 
+    INDEX_FILE = "pali_index.pkl"
+    INDEX_VERSION = 2  # Bump when the index format changes
+    LOAD_WORKERS = 8  # threads reading cached sutta files
+
     def __init__(self, cache_dir: Path = None):
         """
         Initialize the Pali text search.
@@ -71,20 +123,299 @@ class PaliTextSearch:
             cache_dir: Directory containing cached sutta JSON files
         """
         self.cache_dir = cache_dir or (CACHE_PATH / "suttas")
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        self._index: Optional[dict] = None
+        self._index_mtime: Optional[int] = None  # of index_path when loaded
+        self._corpus: Optional[_Corpus] = None
+        self._corpus_state = (0, 0)
+
+    def _load_sutta(self, json_file: Path) -> Optional[dict]:
+        """Load a cached sutta file, or None if it cannot be read."""
+        try:
+            return read_json(json_file)
+        except (JSONDecodeError, UnicodeDecodeError, IOError):
+            return None
+
+    def _cached_file_names(self) -> list[str]:
+        """List the names of the cached sutta files, in directory order."""
+        if not self.cache_dir.exists():
+            return []
+        with os.scandir(self.cache_dir) as entries:
+            return [entry.name for entry in entries if entry.name.endswith(".json")]
 
     def _iter_cached_suttas(self) -> Iterator[tuple[Path, dict]]:
         """Iterate over all cached sutta files."""
+        # Sorting the names keeps search results and index positions in a
+        # stable order. Files are read and parsed in worker threads so disk
+        # reads overlap, and map() still yields them in that order.
+        json_files = [self.cache_dir / name for name in sorted(self._cached_file_names())]
+        with ThreadPoolExecutor(max_workers=self.LOAD_WORKERS) as executor:
+            for json_file, data in zip(json_files, executor.map(self._load_sutta, json_files)):
+                if data is not None:
+                    yield json_file, data
+
+    def _count_cached_files(self) -> int:
+        """Count cached sutta files without parsing them."""
+        return len(self._cached_file_names())
+
+    def _cache_state(self) -> tuple[int, int]:
+        """
+        Get the number of cached sutta files and their latest mtime.
+
+        Ingesting new suttas changes the count and re-ingesting existing
+        ones changes the mtime, so either marks the corpus and index stale.
+        """
         if not self.cache_dir.exists():
-            return
+            return 0, 0
+
+        count = 0
+        latest_mtime = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    count += 1
+                    latest_mtime = max(latest_mtime, entry.stat().st_mtime_ns)
+        return count, latest_mtime
+
+    def _get_corpus(self) -> _Corpus:
+        """
+        Get the Pali text of all cached suttas, loading it on first use.
+
+        Like the inverted index, the corpus is reloaded when cached files
+        are added or rewritten.
+        """
+        cache_state = self._cache_state()
+        if self._corpus is not None and self._corpus_state == cache_state:
+            return self._corpus
+
+        files: list[str] = []
+        uids: list[str] = []
+        sutta_starts = array("I")
+        seg_ids: list[str] = []
+        texts: list[str] = []
+
+        for json_file, sutta_data in self._iter_cached_suttas():
+            root_text = sutta_data.get("root_text", {})
+            if not root_text:
+                continue
+
+            files.append(json_file.name)
+            uids.append(self._get_sutta_uid(root_text))
+            sutta_starts.append(len(seg_ids))
+            seg_ids.extend(root_text)
+            texts.extend(pali_text or "" for pali_text in root_text.values())
+
+        seg_starts = accumulate((len(text) + 1 for text in texts[:-1]), initial=0)
+        corpus = _Corpus(
+            files=files,
+            uids=uids,
+            sutta_starts=sutta_starts,
+            seg_ids=seg_ids,
+            seg_starts=array("I", seg_starts if texts else ()),
+            text=_SEGMENT_SEP.join(texts),
+        )
+
+        self._corpus = corpus
+        self._corpus_state = cache_state
+        return corpus
+
+    @staticmethod
+    def _get_sutta_uid(root_text: dict) -> str:
+        """Get the sutta UID from the first segment ID."""
+        first_key = next(iter(root_text.keys()), "")
+        return first_key.split(":")[0] if ":" in first_key else "unknown"
+
+    @staticmethod
+    def _segment_text(corpus: _Corpus, seg: int) -> str:
+        """Get the Pali text of one segment of the corpus."""
+        start = corpus.seg_starts[seg]
+        if seg + 1 < len(corpus.seg_starts):
+            return corpus.text[start:corpus.seg_starts[seg + 1] - 1]
+        return corpus.text[start:]
+
+    def build_index(self) -> int:
+        """
+        Build and save an inverted index of the cached suttas.
+
+        Maps every lowercased Pali token to the positions of the segments
+        containing it (repeated once per occurrence). Segment positions are
+        numbered across the whole cache in search order, so a position
+        identifies a sutta file and a segment within it.
+
+        Returns:
+            Number of distinct tokens indexed
+        """
+        file_count, latest_mtime = self._cache_state()
+        files: list[str] = []
+        uids: list[str] = []
+        sutta_starts = array("I")  # position of each sutta's first segment
+        postings: dict[str, array] = defaultdict(lambda: array("I"))
+        position = 0
+
+        for json_file, sutta_data in self._iter_cached_suttas():
+            root_text = sutta_data.get("root_text", {})
+            if not root_text:
+                continue
+
+            files.append(json_file.name)
+            uids.append(self._get_sutta_uid(root_text))
+            sutta_starts.append(position)
+
+            for pali_text in root_text.values():
+                if pali_text:
+                    for token in _TOKEN_RE.findall(pali_text.lower()):
+                        postings[token].append(position)
+                position += 1
+
+        index = {
+            "version": self.INDEX_VERSION,
+            "file_count": file_count,
+            "latest_mtime": latest_mtime,
+            "files": files,
+            "uids": uids,
+            "sutta_starts": sutta_starts,
+            "postings": dict(postings),
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._index = index
+        self._index_mtime = self.index_path.stat().st_mtime_ns
+        return len(index["postings"])
+
+    def _get_index(self, term: str, case_sensitive: bool) -> Optional[dict]:
+        """
+        Get the inverted index if it can answer a search for this term.
+
+        The index holds lowercased single tokens, so it is only used for
+        case-insensitive searches of one word, and only while it still
+        matches the set of cached files. The index is reloaded whenever
+        the file on disk changes (e.g. rebuilt by another process after
+        ingesting more suttas).
+        """
+        if case_sensitive or not _TOKEN_RE.fullmatch(term):
+            return None
+
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except OSError:
+            return None
 
-        for json_file in sorted(self.cache_dir.glob("*.json")):
+        if self._index is None or self._index_mtime != mtime:
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    yield json_file, data
-            except (json.JSONDecodeError, IOError):
+                with open(self.index_path, "rb") as f:
+                    self._index = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, IOError):
+                self._index = None
+                return None
+            self._index_mtime = mtime
+
+        if (
+            self._index.get("version") != self.INDEX_VERSION
+            or (self._index["file_count"], self._index["latest_mtime"]) != self._cache_state()
+        ):
+            return None
+
+        return self._index
+
+    def _index_hits(self, index: dict, term: str, whole_word: bool) -> dict[int, int]:
+        """Map segment positions to the number of occurrences of a term."""
+        postings = index["postings"]
+        needle = term.lower()
+
+        if whole_word:
+            tokens = [needle] if needle in postings else []
+        else:
+            tokens = [token for token in postings if needle in token]
+
+        hits: dict[int, int] = defaultdict(int)
+        for token in tokens:
+            occurrences = 1 if whole_word else token.count(needle)
+            for position in postings[token]:
+                hits[position] += occurrences
+        return hits
+
+    def _search_index(
+        self,
+        index: dict,
+        term: str,
+        pattern: re.Pattern,
+        whole_word: bool,
+        limit: int,
+    ) -> PaliSearchResult:
+        """Search using the inverted index, loading only matching suttas."""
+        hits = self._index_hits(index, term, whole_word)
+        sutta_starts = index["sutta_starts"]
+
+        # Group hits by sutta: sutta index -> {segment offset: count}
+        by_sutta: dict[int, dict[int, int]] = defaultdict(dict)
+        for position, count in hits.items():
+            sutta_idx = bisect_right(sutta_starts, position) - 1
+            by_sutta[sutta_idx][position - sutta_starts[sutta_idx]] = count
+
+        matches = []
+        for sutta_idx in sorted(by_sutta):
+            if len(matches) >= limit:
+                break
+
+            sutta_data = self._load_sutta(self.cache_dir / index["files"][sutta_idx])
+            if sutta_data is None:
                 continue
 
+            root_text = sutta_data.get("root_text", {})
+            translation_text = sutta_data.get("translation_text", {})
+            segment_counts = by_sutta[sutta_idx]
+
+            for offset, (seg_id, pali_text) in enumerate(root_text.items()):
+                match_count = segment_counts.get(offset)
+                if match_count is None:
+                    continue
+
+                first_match = pattern.search(pali_text)
+                matches.append(PaliMatch(
+                    sutta_uid=index["uids"][sutta_idx],
+                    segment_id=seg_id,
+                    pali_text=pali_text,
+                    english_text=translation_text.get(seg_id, ""),
+                    match_term=first_match.group(0) if first_match else term,
+                    match_count=match_count,
+                ))
+                if len(matches) >= limit:
+                    break
+
+        return PaliSearchResult(
+            term=term,
+            total_occurrences=sum(hits.values()),
+            sutta_count=len({index["uids"][i] for i in by_sutta}),
+            matches=matches,
+        )
+
+    @staticmethod
+    def _scan_corpus(corpus: _Corpus, term: str, pattern: re.Pattern) -> dict[int, list]:
+        """
+        Find the segments of the corpus matching a pattern.
+
+        Returns:
+            Segment number -> [first match form, match count], in text order
+        """
+        if _SEGMENT_SEP in term or not corpus.seg_ids:
+            # The separator can't occur in segment text, and would match
+            # across segments
+            return {}
+
+        # Scan the whole corpus in one regex pass rather than sutta by sutta
+        segment_matches: dict[int, list] = {}
+        for match in pattern.finditer(corpus.text):
+            seg = bisect_right(corpus.seg_starts, match.start()) - 1
+            found = segment_matches.get(seg)
+            if found is None:
+                segment_matches[seg] = [match.group(0), 1]
+            else:
+                found[1] += 1
+        return segment_matches
+
     def search(
         self,
         term: str,
@@ -104,54 +435,42 @@ class PaliTextSearch:
         Returns:
             PaliSearchResult with matches and counts
         """
-        matches = []
-        total_occurrences = 0
-        suttas_with_matches = set()
-
-        # Build regex pattern
-        flags = 0 if case_sensitive else re.IGNORECASE
-        if whole_word:
-            pattern = re.compile(rf'\b{re.escape(term)}\b', flags)
-        else:
-            pattern = re.compile(re.escape(term), flags)
+        pattern = _get_pattern(term, case_sensitive, whole_word)
 
-        for _, sutta_data in self._iter_cached_suttas():
-            root_text = sutta_data.get("root_text", {})
-            translation_text = sutta_data.get("translation_text", {})
-
-            if not root_text:
-                continue
+        index = self._get_index(term, case_sensitive)
+        if index is not None:
+            return self._search_index(index, term, pattern, whole_word, limit)
 
-            # Get sutta UID from first segment
-            first_key = next(iter(root_text.keys()), "")
-            sutta_uid = first_key.split(":")[0] if ":" in first_key else "unknown"
+        corpus = self._get_corpus()
+        segment_matches = self._scan_corpus(corpus, term, pattern)
 
-            sutta_match_count = 0
+        total_occurrences = sum(count for _, count in segment_matches.values())
+        suttas_with_matches = {
+            corpus.uids[bisect_right(corpus.sutta_starts, seg) - 1]
+            for seg in segment_matches
+        }
 
-            for seg_id, pali_text in root_text.items():
-                if not pali_text:
-                    continue
-
-                # Find all matches in this segment
-                segment_matches = pattern.findall(pali_text)
-                if segment_matches:
-                    match_count = len(segment_matches)
-                    total_occurrences += match_count
-                    sutta_match_count += match_count
-
-                    if len(matches) < limit:
-                        english_text = translation_text.get(seg_id, "")
-                        matches.append(PaliMatch(
-                            sutta_uid=sutta_uid,
-                            segment_id=seg_id,
-                            pali_text=pali_text,
-                            english_text=english_text,
-                            match_term=segment_matches[0],  # First match form
-                            match_count=match_count,
-                        ))
-
-            if sutta_match_count > 0:
-                suttas_with_matches.add(sutta_uid)
+        # Only the first `limit` matching segments are built into matches
+        matches = []
+        translation_sutta = None
+        translation_text = {}
+        for seg, (match_term, match_count) in islice(segment_matches.items(), limit):
+            sutta_idx = bisect_right(corpus.sutta_starts, seg) - 1
+            if sutta_idx != translation_sutta:
+                # Only the Pali text is kept in memory
+                sutta_data = self._load_sutta(self.cache_dir / corpus.files[sutta_idx]) or {}
+                translation_sutta = sutta_idx
+                translation_text = sutta_data.get("translation_text", {})
+
+            seg_id = corpus.seg_ids[seg]
+            matches.append(PaliMatch(
+                sutta_uid=corpus.uids[sutta_idx],
+                segment_id=seg_id,
+                pali_text=self._segment_text(corpus, seg),
+                english_text=translation_text.get(seg_id, ""),
+                match_term=match_term,  # First match form
+                match_count=match_count,
+            ))
 
         return PaliSearchResult(
             term=term,
@@ -171,19 +490,40 @@ class PaliTextSearch:
         Returns:
             Dictionary mapping sutta_uid to occurrence count
         """
-        result = self.search(term, case_sensitive=case_sensitive, limit=10000)
-
-        counts: dict[str, int] = {}
-        for match in result.matches:
-            if match.sutta_uid not in counts:
-                counts[match.sutta_uid] = 0
-            counts[match.sutta_uid] += match.match_count
-
-        return counts
+        index = self._get_index(term, case_sensitive)
+        if index is not None:
+            sutta_starts = index["sutta_starts"]
+            index_counts: dict[str, int] = defaultdict(int)
+            for position, count in self._index_hits(index, term, whole_word=False).items():
+                sutta_uid = index["uids"][bisect_right(sutta_starts, position) - 1]
+                index_counts[sutta_uid] += count
+            return dict(index_counts)
+
+        return self._count_by_sutta(term, case_sensitive)
+
+    def _count_by_sutta(self, term: str, case_sensitive: bool) -> dict[str, int]:
+        """Count occurrences of a term by sutta by scanning the corpus."""
+        corpus = self._get_corpus()
+        counts: dict[str, int] = defaultdict(int)
+
+        if case_sensitive and term and _SEGMENT_SEP not in term:
+            # A literal count needs no regex: str.count scans each sutta's
+            # part of the buffer in place
+            text = corpus.text
+            bounds = [corpus.seg_starts[seg] for seg in corpus.sutta_starts]
+            bounds.append(len(text) + 1)
+            for uid, start, end in zip(corpus.uids, bounds, bounds[1:]):
+                match_count = text.count(term, start, end - 1)
+                if match_count:
+                    counts[uid] += match_count
+            return dict(counts)
+
+        pattern = _get_pattern(term, case_sensitive, False)
+        for seg, (_, match_count) in self._scan_corpus(corpus, term, pattern).items():
+            counts[corpus.uids[bisect_right(corpus.sutta_starts, seg) - 1]] += match_count
+
+        return dict(counts)
 
     def get_cached_sutta_count(self) -> int:
         """Get the number of cached suttas available for search."""
-        count = 0
-        for _ in self._iter_cached_suttas():
-            count += 1
-        return count
+        return self._count_cached_files()
@@ -0,0 +1,49 @@
+"""Pickle caches of parsed dictionary data, derived from the JSON caches."""
+
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+
+def load_pickle(path: Path, version: int, source_path: Path) -> Optional[Any]:
+    """
+    Load data from a pickle cache if it is current.
+
+    Args:
+        path: Path of the pickle cache
+        version: Expected format version
+        source_path: The JSON cache the pickle was derived from
+
+    Returns:
+        The cached data, or None if missing, stale or unreadable
+    """
+    if not path.exists():
+        return None
+
+    # The pickle is derived from the JSON cache, so it is stale if older
+    if path.stat().st_mtime < source_path.stat().st_mtime:
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            # Check the version before unpickling data of an older layout
+            if pickle.load(f) != version:
+                return None
+            return pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, AttributeError, IOError):
+        return None
+
+
+def save_pickle(path: Path, version: int, data: Any) -> None:
+    """
+    Save data to a pickle cache.
+
+    The pickle only speeds up later loads, so failing to write it (e.g. a
+    read-only cache directory or a full disk) is not an error.
+    """
+    try:
+        with open(path, "wb") as f:
+            pickle.dump(version, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
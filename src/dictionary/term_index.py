@@ -0,0 +1,94 @@
+"""Sorted index of dictionary terms for fast prefix and substring search."""
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable, Optional
+
+NGRAM_SIZE = 3
+
+
+class TermIndex:
+    """
+    Sorted list of dictionary terms.
+
+    Terms sharing a prefix are contiguous in sorted order, so a prefix
+    query is a binary search followed by a short scan, instead of a
+    startswith() check against every term. Substring queries use an
+    index of each term's 3-grams, built on first use, to narrow the
+    candidates before checking them.
+    """
+
+    def __init__(self, terms: Iterable[str] = ()):
+        """
+        Build the index.
+
+        Args:
+            terms: Terms to index (normally the dictionary's lowercase keys)
+        """
+        self._terms = sorted(terms)
+        self._ngrams: Optional[dict[str, list[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def prefix(self, prefix: str, limit: int) -> list[str]:
+        """
+        Find terms starting with a prefix.
+
+        Args:
+            prefix: The prefix to match
+            limit: Maximum number of terms to return
+
+        Returns:
+            Matching terms in sorted order
+        """
+        start = bisect_left(self._terms, prefix)
+        matches = []
+        for term in self._terms[start:start + limit]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def _build_ngrams(self) -> dict[str, list[int]]:
+        """Map each n-gram to the (ascending) positions of terms containing it."""
+        ngrams: dict[str, list[int]] = defaultdict(list)
+        for i, term in enumerate(self._terms):
+            for gram in {term[j:j + NGRAM_SIZE] for j in range(len(term) - NGRAM_SIZE + 1)}:
+                ngrams[gram].append(i)
+        return dict(ngrams)
+
+    def containing(self, pattern: str, limit: int) -> list[str]:
+        """
+        Find terms containing a substring.
+
+        Args:
+            pattern: The substring to match
+            limit: Maximum number of terms to return
+
+        Returns:
+            Matching terms in sorted order
+        """
+        if len(pattern) < NGRAM_SIZE:
+            # Too short to narrow down, so check every term
+            candidates = range(len(self._terms))
+        else:
+            if self._ngrams is None:
+                self._ngrams = self._build_ngrams()
+
+            # A match must contain every n-gram of the pattern
+            postings = sorted(
+                (self._ngrams.get(pattern[j:j + NGRAM_SIZE], [])
+                 for j in range(len(pattern) - NGRAM_SIZE + 1)),
+                key=len,
+            )
+            candidates = sorted(set(postings[0]).intersection(*postings[1:]))
+
+        matches = []
+        for i in candidates:
+            term = self._terms[i]
+            if pattern in term:
+                matches.append(term)
+                if len(matches) >= limit:
+                    break
+        return matches
@@ -1,6 +1,8 @@
 """Sutta search engine for exhaustive semantic search with grouping by sutta."""
 
 from dataclasses import dataclass, field
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from typing import Optional
 
 from ..indexing import VectorStoreManager
@@ -28,6 +30,11 @@ class SearchResults:
     results: list[SuttaSearchResult]  # sorted by best_score descending
 
 
+def _sutta_uid(node) -> str:
+    """Get the sutta UID a retrieved node belongs to."""
+    return node.metadata.get("sutta_uid", "unknown")
+
+
 class SuttaSearchEngine:
     """
     Search engine for exhaustive semantic search across the Sutta Pitaka.
@@ -72,41 +79,51 @@ class SuttaSearchEngine:
                 results=[],
             )
 
-        # Group nodes by sutta_uid
-        sutta_groups: dict[str, list] = {}
-        for node in nodes:
-            uid = node.metadata.get("sutta_uid", "unknown")
-            if uid not in sutta_groups:
-                sutta_groups[uid] = []
-            sutta_groups[uid].append(node)
+        # Number suttas in order of first retrieval, so that suttas with
+        # equal best scores keep that order after the final sort
+        node_uids = [_sutta_uid(node) for node in nodes]
+        uids = list(dict.fromkeys(node_uids))
+        sutta_ranks = {uid: rank for rank, uid in enumerate(uids)}
+
+        # Sort once so each sutta's nodes are adjacent and best-first,
+        # then group them in a single pass. The sort keys are computed once
+        # up front; the index breaks ties without comparing nodes.
+        ranked = sorted(
+            (sutta_ranks[uid], -node.score, i, node)
+            for i, (uid, node) in enumerate(zip(node_uids, nodes))
+        )
 
         # Build results for each sutta
         results = []
-        for uid, sutta_nodes in sutta_groups.items():
-            # Find best scoring node for this sutta
-            best_node = max(sutta_nodes, key=lambda n: n.score)
+        for rank, group in groupby(ranked, key=itemgetter(0)):
+            uid = uids[rank]
+            sutta_nodes = [entry[3] for entry in group]
+
+            # Best scoring node for this sutta comes first
+            best_node = sutta_nodes[0]
+            best_metadata = best_node.metadata
 
-            # Get top 3 snippets sorted by score
-            sorted_nodes = sorted(sutta_nodes, key=lambda n: -n.score)[:3]
+            # Get top 3 snippets (already sorted by score)
             snippets = []
-            for node in sorted_nodes:
+            for node in sutta_nodes[:3]:
+                text = node.text
                 snippets.append({
-                    "text": node.text[:300] + "..." if len(node.text) > 300 else node.text,
+                    "text": text if len(text) <= 300 else f"{text[:300]}...",
                     "segment_range": node.metadata.get("segment_range", ""),
                     "score": node.score,
                 })
 
             results.append(SuttaSearchResult(
                 sutta_uid=uid,
-                title=best_node.metadata.get("title", "Unknown"),
-                nikaya=best_node.metadata.get("nikaya", ""),
+                title=best_metadata.get("title", "Unknown"),
+                nikaya=best_metadata.get("nikaya", ""),
                 best_score=best_node.score,
                 match_count=len(sutta_nodes),
                 snippets=snippets,
             ))
 
         # Sort by best score descending
-        results.sort(key=lambda r: -r.best_score)
+        results.sort(key=attrgetter("best_score"), reverse=True)
 
         return SearchResults(
             query=query,
@@ -0,0 +1,34 @@
+"""Tests for DPPN entry formatting."""
+
+import unittest
+
+from src.dictionary.dppn import DPPNEntry
+
+
+class DPPNEntryFormatTest(unittest.TestCase):
+    """DPPNEntry.format converts entry HTML to markdown."""
+
+    def test_emphasis_inside_ref_link(self):
+        entry = DPPNEntry(
+            word="Devatā",
+            text="<p>See <a class='ref' href='https://suttacentral.net/sn1.1'><i>SN</i> 1.1</a>.</p>",
+        )
+        self.assertEqual(
+            entry.format(),
+            "**Devatā**\n\nSee [*SN* 1.1](https://suttacentral.net/sn1.1).",
+        )
+
+    def test_paragraph_with_attributes_adds_no_newline(self):
+        entry = DPPNEntry(
+            word="Sāriputta",
+            text="before<p class='person'>chief disciple</p>",
+            entry_type="person",
+        )
+        self.assertEqual(
+            entry.format(),
+            "**Sāriputta** (person)\n\nbeforechief disciple",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()